@@ -7,7 +7,8 @@ from .device_manager import (
     DeviceConfig,
     ConnectionType,
     FunctionCode,
-    OperationResult
+    OperationResult,
+    ReadPayload
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     'DeviceConfig',
     'ConnectionType',
     'FunctionCode',
-    'OperationResult'
+    'OperationResult',
+    'ReadPayload'
 ]
@@ -2,10 +2,14 @@
 Modbus 设备管理器
 支持多设备并发连接，包括 RTU 和 TCP 设备
 """
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial, wraps
+import os
 import threading
+import time
 from pymodbus.client import ModbusSerialClient, ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
@@ -35,7 +39,7 @@ class FunctionCode(Enum):
     WRITE_FILE_RECORD = 21  # 写文件记录
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConfig:
     """设备配置数据类"""
     device_id: str  # 设备唯一标识
@@ -58,29 +62,207 @@ class DeviceConfig:
     timeout: float = 3.0  # 超时时间（秒）
 
 
-@dataclass
+def _transport_key(config: DeviceConfig) -> tuple:
+    """影响底层连接的配置项，任一变化都需要重新连接"""
+    return (
+        config.connection_type,
+        config.port, config.baudrate, config.bytesize, config.parity, config.stopbits,
+        config.host, config.tcp_port,
+        config.timeout,
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class OperationResult:
-    """操作结果数据类"""
+    """操作结果数据类（不可变，可安全复用）"""
     success: bool  # 操作是否成功
     data: Any = None  # 返回数据
     error: Optional[str] = None  # 错误信息
 
 
+@dataclass(frozen=True, slots=True)
+class ReadPayload:
+    """读取操作返回数据"""
+    address: int  # 起始地址
+    count: int  # 读取数量
+    values: List[Any]  # 读取到的值
+
+
+# 设备未连接时的共享结果，避免轮询未连接设备时重复创建
+_NOT_CONNECTED = OperationResult(False, error="设备未连接")
+
+
+class _NotConnected(Exception):
+    """请求锁内复查时发现设备已断开"""
+
+
+@dataclass(slots=True)
+class _PooledTcpClient:
+    """共享 TCP 客户端条目"""
+    client: ModbusTcpClient  # 共享的 TCP 客户端
+    lock: threading.Lock  # 客户端请求锁，保证请求/响应顺序
+    refcount: int = 0  # 引用计数
+
+
+def _modbus_call(error_prefix: str):
+    """
+    Modbus 请求方法装饰器：统一处理连接检查和异常包装
+    
+    这里的连接检查不持锁，只是快速路径；_transact 持有请求锁后会再次检查。
+    
+    Args:
+        error_prefix: 异常时错误信息的前缀
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs) -> OperationResult:
+            if not self.connected or not self.client:
+                return _NOT_CONNECTED
+            try:
+                return fn(self, *args, **kwargs)
+            except _NotConnected:
+                return _NOT_CONNECTED
+            except Exception as e:
+                return OperationResult(False, error=f"{error_prefix}: {str(e)}")
+        return wrapper
+    return decorator
+
+
+def _coalesce_ranges(ranges: List[Tuple[int, int]], max_gap: int,
+                     max_count: int) -> List[Tuple[int, int, List[Tuple[int, int]]]]:
+    """
+    合并相邻或重叠的读取地址段
+    
+    Args:
+        ranges: 地址段列表 [(起始地址, 数量), ...]
+        max_gap: 允许合并的最大地址间隙
+        max_count: 单次请求的最大数量
+        
+    Returns:
+        [(起始地址, 数量, 包含的原始地址段), ...]
+    """
+    groups: List[Tuple[int, int, List[Tuple[int, int]]]] = []
+    for address, count in sorted(set(ranges)):
+        if groups:
+            start, end, members = groups[-1]
+            new_end = max(end, address + count)
+            if address - end <= max_gap and new_end - start <= max_count:
+                members.append((address, count))
+                groups[-1] = (start, new_end, members)
+                continue
+        groups.append((address, address + count, [(address, count)]))
+    
+    return [(start, end - start, members) for start, end, members in groups]
+
+
 class ModbusDevice:
     """单个 Modbus 设备封装"""
     
-    def __init__(self, config: DeviceConfig):
+    # 读功能码分发表 {功能码: (客户端方法名, 响应数据属性, 数据类型描述, 单次最大数量)}
+    _READ_FUNCS = {
+        1: ('read_coils', 'bits', '线圈', 2000),
+        2: ('read_discrete_inputs', 'bits', '离散输入', 2000),
+        3: ('read_holding_registers', 'registers', '保持寄存器', 125),
+        4: ('read_input_registers', 'registers', '输入寄存器', 125),
+    }
+    
+    # 批量读取时允许合并的最大地址间隙
+    DEFAULT_MAX_GAP = 4
+    
+    # 连接后预绑定的客户端请求方法
+    _REQUEST_METHODS = (
+        'read_coils', 'read_discrete_inputs',
+        'read_holding_registers', 'read_input_registers',
+        'write_coil', 'write_register', 'write_coils', 'write_registers',
+    )
+    
+    __slots__ = (
+        'config', 'manager', 'client', 'connected', 'lock', 'client_lock',
+        'pool_key', 'error_message', 'silent_interval', '_last_io', '_requests',
+    )
+    
+    def __init__(self, config: DeviceConfig, manager: Optional['DeviceManager'] = None):
         """
         初始化设备
         
         Args:
             config: 设备配置
+            manager: 所属设备管理器，用于共享 TCP 连接（可选）
         """
         self.config = config
+        self.manager = manager
         self.client: Optional[Any] = None
         self.connected = False
-        self.lock = threading.Lock()  # 线程锁，保证并发安全
+        self.lock = threading.Lock()  # 连接状态锁，串行化 connect/disconnect
+        self.client_lock = threading.Lock()  # 客户端请求锁，共享连接时与其他设备共用
+        self.pool_key: Optional[Tuple[str, int, float]] = None  # 共享 TCP 连接键
         self.error_message: Optional[str] = None
+        
+        # RTU 帧间静默间隔（3.5 个字符时间，秒），TCP 为 0
+        self.silent_interval = 0.0
+        self._last_io = 0.0  # 上一次收发结束的时间
+        
+        # 预绑定从站地址的请求方法 {方法名: 可调用对象}，连接成功后生成
+        self._requests: Dict[str, Any] = {}
+    
+    def _build_rtu(self) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        创建 RTU 客户端
+        
+        Returns:
+            (客户端, 错误信息)
+        """
+        if not self.config.port:
+            return None, "RTU 模式需要指定串口端口"
+        
+        client = ModbusSerialClient(
+            method='rtu',
+            port=self.config.port,
+            baudrate=self.config.baudrate,
+            bytesize=self.config.bytesize,
+            parity=self.config.parity,
+            stopbits=self.config.stopbits,
+            timeout=self.config.timeout
+        )
+        
+        # 每个字符 = 起始位 + 数据位 + 校验位 + 停止位
+        char_bits = (1 + self.config.bytesize
+                     + (0 if self.config.parity == 'N' else 1)
+                     + self.config.stopbits)
+        self.silent_interval = 3.5 * char_bits / self.config.baudrate
+        return client, None
+    
+    def _build_tcp(self) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        创建 TCP 客户端
+        
+        Returns:
+            (客户端, 错误信息)
+        """
+        if not self.config.host:
+            return None, "TCP 模式需要指定主机地址"
+        
+        # 编辑配置可能让同一设备对象从 RTU 切换到 TCP，清除 RTU 帧间隔状态
+        self.silent_interval = 0.0
+        self._last_io = 0.0
+        
+        if self.manager:
+            # 同一 host:port 的设备共享一个 TCP 连接
+            self.pool_key, client, self.client_lock = \
+                self.manager.acquire_tcp_client(self.config)
+            return client, None
+        
+        return ModbusTcpClient(
+            host=self.config.host,
+            port=self.config.tcp_port,
+            timeout=self.config.timeout
+        ), None
+    
+    # 客户端工厂表 {连接类型: 创建方法}
+    _CLIENT_FACTORIES = {
+        ConnectionType.RTU: _build_rtu,
+        ConnectionType.TCP: _build_tcp,
+    }
     
     def connect(self) -> OperationResult:
         """
@@ -91,47 +273,43 @@ class ModbusDevice:
         """
         with self.lock:
             try:
-                if self.config.connection_type == ConnectionType.RTU:
-                    # 创建 RTU 客户端
-                    if not self.config.port:
-                        return OperationResult(False, error="RTU 模式需要指定串口端口")
-                    
-                    self.client = ModbusSerialClient(
-                        method='rtu',
-                        port=self.config.port,
-                        baudrate=self.config.baudrate,
-                        bytesize=self.config.bytesize,
-                        parity=self.config.parity,
-                        stopbits=self.config.stopbits,
-                        timeout=self.config.timeout
-                    )
+                factory = self._CLIENT_FACTORIES.get(self.config.connection_type)
+                if factory is None:
+                    return OperationResult(False, error=f"不支持的连接类型: {self.config.connection_type}")
                 
-                elif self.config.connection_type == ConnectionType.TCP:
-                    # 创建 TCP 客户端
-                    if not self.config.host:
-                        return OperationResult(False, error="TCP 模式需要指定主机地址")
-                    
-                    self.client = ModbusTcpClient(
-                        host=self.config.host,
-                        port=self.config.tcp_port,
-                        timeout=self.config.timeout
-                    )
+                self._release_client()
+                client, error = factory(self)
+                if error:
+                    return OperationResult(False, error=error)
+                self.client = client
                 
-                # 连接到设备
-                self.connected = self.client.connect()
+                # 连接到设备（共享连接已建立时直接返回），请求方法在请求锁内与连接状态一起就绪
+                with self.client_lock:
+                    self.connected = self.client.connect()
+                    if self.connected:
+                        self._bind_requests()
                 
                 if self.connected:
                     self.error_message = None
                     return OperationResult(True, data=f"设备 {self.config.name} 连接成功")
                 else:
+                    self._release_client()
                     self.error_message = "连接失败"
                     return OperationResult(False, error="连接失败")
                     
             except Exception as e:
+                self._release_client()
                 self.error_message = str(e)
                 self.connected = False
                 return OperationResult(False, error=f"连接异常: {str(e)}")
     
+    def _bind_requests(self) -> None:
+        """按当前客户端和从站地址预先绑定请求方法（两者在连接期间不变，需持 self.lock 调用）"""
+        self._requests = {
+            name: partial(getattr(self.client, name), slave=self.config.slave_id)
+            for name in self._REQUEST_METHODS
+        }
+    
     def disconnect(self) -> OperationResult:
         """
         断开设备连接
@@ -142,8 +320,17 @@ class ModbusDevice:
         with self.lock:
             try:
                 if self.client and self.connected:
-                    self.client.close()
-                    self.connected = False
+                    # 等待进行中的请求完成后在请求锁内解除客户端绑定，
+                    # 之后的请求不会再使用已关闭（或已归还连接池）的客户端
+                    with self.client_lock:
+                        client = self.client
+                        self.connected = False
+                        self.client = None
+                        self._requests = {}
+                        if not self.pool_key:
+                            client.close()
+                    # 共享连接归还连接池（关闭时会获取同一把请求锁，需在锁外进行）
+                    self._release_client()
                     self.error_message = None
                     return OperationResult(True, data="断开连接成功")
                 return OperationResult(True, data="设备未连接")
@@ -152,106 +339,153 @@ class ModbusDevice:
     
     def read_coils(self, address: int, count: int) -> OperationResult:
         """读取线圈 (功能码 01)"""
-        return self._read_operation(1, address, count, "线圈")
+        return self._read_operation(1, address, count)
     
     def read_discrete_inputs(self, address: int, count: int) -> OperationResult:
         """读取离散输入 (功能码 02)"""
-        return self._read_operation(2, address, count, "离散输入")
+        return self._read_operation(2, address, count)
     
     def read_holding_registers(self, address: int, count: int) -> OperationResult:
         """读取保持寄存器 (功能码 03)"""
-        return self._read_operation(3, address, count, "保持寄存器")
+        return self._read_operation(3, address, count)
     
     def read_input_registers(self, address: int, count: int) -> OperationResult:
         """读取输入寄存器 (功能码 04)"""
-        return self._read_operation(4, address, count, "输入寄存器")
+        return self._read_operation(4, address, count)
+    
+    def read_coils_batch(self, ranges: List[Tuple[int, int]],
+                         max_gap: int = DEFAULT_MAX_GAP) -> OperationResult:
+        """批量读取线圈 (功能码 01)，合并相邻地址段"""
+        return self.read_batch(1, ranges, max_gap)
+    
+    def read_discrete_inputs_batch(self, ranges: List[Tuple[int, int]],
+                                   max_gap: int = DEFAULT_MAX_GAP) -> OperationResult:
+        """批量读取离散输入 (功能码 02)，合并相邻地址段"""
+        return self.read_batch(2, ranges, max_gap)
+    
+    def read_holding_registers_batch(self, ranges: List[Tuple[int, int]],
+                                     max_gap: int = DEFAULT_MAX_GAP) -> OperationResult:
+        """批量读取保持寄存器 (功能码 03)，合并相邻地址段"""
+        return self.read_batch(3, ranges, max_gap)
+    
+    def read_input_registers_batch(self, ranges: List[Tuple[int, int]],
+                                   max_gap: int = DEFAULT_MAX_GAP) -> OperationResult:
+        """批量读取输入寄存器 (功能码 04)，合并相邻地址段"""
+        return self.read_batch(4, ranges, max_gap)
+    
+    def read_batch(self, func_code: int, ranges: List[Tuple[int, int]],
+                   max_gap: int = DEFAULT_MAX_GAP) -> OperationResult:
+        """
+        批量读取多个地址段
+        
+        按起始地址排序后，将间隙不超过 max_gap 且总长度不超过协议上限的地址段
+        合并为一次请求，再把结果切分回各个地址段。合并后会顺带读取间隙中的地址，
+        对读取有副作用的设备应将 max_gap 设为 0。
+        
+        Args:
+            func_code: 功能码 (1-4)
+            ranges: 地址段列表 [(起始地址, 数量), ...]
+            max_gap: 允许合并的最大地址间隙
+            
+        Returns:
+            操作结果，成功时 data 为 {(起始地址, 数量): 值列表}
+        """
+        entry = self._READ_FUNCS.get(func_code)
+        if entry is None:
+            return OperationResult(False, error=f"不支持的功能码: {func_code}")
+        
+        values: Dict[Tuple[int, int], List[Any]] = {}
+        for start, count, members in _coalesce_ranges(ranges, max_gap, entry[3]):
+            result = self._read_operation(func_code, start, count)
+            if not result.success:
+                return result
+            
+            group_values = result.data.values
+            for address, length in members:
+                offset = address - start
+                values[(address, length)] = group_values[offset:offset + length]
+        
+        return OperationResult(True, data=values)
     
+    @_modbus_call("写入异常")
     def write_single_coil(self, address: int, value: bool) -> OperationResult:
         """写单个线圈 (功能码 05)"""
-        with self.lock:
-            if not self.connected or not self.client:
-                return OperationResult(False, error="设备未连接")
-            
-            try:
-                response = self.client.write_coil(
-                    address=address,
-                    value=value,
-                    slave=self.config.slave_id
-                )
-                
-                if response.isError():
-                    return OperationResult(False, error=f"写入失败: {response}")
-                
-                return OperationResult(True, data={"address": address, "value": value})
-                
-            except Exception as e:
-                return OperationResult(False, error=f"写入异常: {str(e)}")
+        response, is_error = self._transact('write_coil', address=address, value=value)
+        if is_error:
+            return OperationResult(False, error=f"写入失败: {response}")
+        
+        return OperationResult(True, data={"address": address, "value": value})
     
+    @_modbus_call("写入异常")
     def write_single_register(self, address: int, value: int) -> OperationResult:
         """写单个寄存器 (功能码 06)"""
-        with self.lock:
-            if not self.connected or not self.client:
-                return OperationResult(False, error="设备未连接")
-            
-            try:
-                response = self.client.write_register(
-                    address=address,
-                    value=value,
-                    slave=self.config.slave_id
-                )
-                
-                if response.isError():
-                    return OperationResult(False, error=f"写入失败: {response}")
-                
-                return OperationResult(True, data={"address": address, "value": value})
-                
-            except Exception as e:
-                return OperationResult(False, error=f"写入异常: {str(e)}")
+        response, is_error = self._transact('write_register', address=address, value=value)
+        if is_error:
+            return OperationResult(False, error=f"写入失败: {response}")
+        
+        return OperationResult(True, data={"address": address, "value": value})
     
+    @_modbus_call("写入异常")
     def write_multiple_coils(self, address: int, values: List[bool]) -> OperationResult:
         """写多个线圈 (功能码 15)"""
-        with self.lock:
-            if not self.connected or not self.client:
-                return OperationResult(False, error="设备未连接")
-            
-            try:
-                response = self.client.write_coils(
-                    address=address,
-                    values=values,
-                    slave=self.config.slave_id
-                )
-                
-                if response.isError():
-                    return OperationResult(False, error=f"写入失败: {response}")
-                
-                return OperationResult(True, data={"address": address, "count": len(values)})
-                
-            except Exception as e:
-                return OperationResult(False, error=f"写入异常: {str(e)}")
+        response, is_error = self._transact('write_coils', address=address, values=values)
+        if is_error:
+            return OperationResult(False, error=f"写入失败: {response}")
+        
+        return OperationResult(True, data={"address": address, "count": len(values)})
     
+    @_modbus_call("写入异常")
     def write_multiple_registers(self, address: int, values: List[int]) -> OperationResult:
         """写多个寄存器 (功能码 16)"""
-        with self.lock:
-            if not self.connected or not self.client:
-                return OperationResult(False, error="设备未连接")
+        response, is_error = self._transact('write_registers', address=address, values=values)
+        if is_error:
+            return OperationResult(False, error=f"写入失败: {response}")
+        
+        return OperationResult(True, data={"address": address, "count": len(values)})
+    
+    def _transact(self, method_name: str, **kwargs) -> Tuple[Any, bool]:
+        """
+        执行一次 Modbus 请求
+        
+        持有客户端请求锁完成整个请求/响应；RTU 模式下先等待帧间静默间隔
+        并清空串口残留输入，避免前一帧的残余数据污染本次响应。
+        
+        Args:
+            method_name: 客户端请求方法名
+            **kwargs: 请求参数（从站地址已预先绑定）
             
+        Returns:
+            (响应, 是否为错误响应)
+            
+        Raises:
+            _NotConnected: 等待请求锁期间设备已断开
+        """
+        with self.client_lock:
+            if not self.connected or self.client is None:
+                raise _NotConnected()
+            # 按实际传输类型判断，避免残留状态把串口专用调用发给 TCP socket
+            if isinstance(self.client, ModbusSerialClient):
+                delay = self.silent_interval - (time.monotonic() - self._last_io)
+                if delay > 0:
+                    time.sleep(delay)
+                serial_port = self.client.socket
+                if serial_port is not None:
+                    serial_port.reset_input_buffer()
             try:
-                response = self.client.write_registers(
-                    address=address,
-                    values=values,
-                    slave=self.config.slave_id
-                )
-                
-                if response.isError():
-                    return OperationResult(False, error=f"写入失败: {response}")
-                
-                return OperationResult(True, data={"address": address, "count": len(values)})
-                
-            except Exception as e:
-                return OperationResult(False, error=f"写入异常: {str(e)}")
+                response = self._requests[method_name](**kwargs)
+                return response, response.isError()
+            finally:
+                self._last_io = time.monotonic()
     
-    def _read_operation(self, func_code: int, address: int, count: int, 
-                        data_type: str) -> OperationResult:
+    def _release_client(self) -> None:
+        """释放共享的 TCP 连接（未共享时不做任何操作）"""
+        if self.pool_key and self.manager:
+            self.manager.release_tcp_client(self.pool_key)
+            self.client_lock = threading.Lock()
+        self.pool_key = None
+    
+    @_modbus_call("读取异常")
+    def _read_operation(self, func_code: int, address: int, count: int) -> OperationResult:
         """
         通用读取操作
         
@@ -259,52 +493,32 @@ class ModbusDevice:
             func_code: 功能码
             address: 起始地址
             count: 读取数量
-            data_type: 数据类型描述
             
         Returns:
             操作结果
         """
-        with self.lock:
-            if not self.connected or not self.client:
-                return OperationResult(False, error="设备未连接")
-            
-            try:
-                if func_code == 1:
-                    response = self.client.read_coils(
-                        address=address, count=count, slave=self.config.slave_id
-                    )
-                elif func_code == 2:
-                    response = self.client.read_discrete_inputs(
-                        address=address, count=count, slave=self.config.slave_id
-                    )
-                elif func_code == 3:
-                    response = self.client.read_holding_registers(
-                        address=address, count=count, slave=self.config.slave_id
-                    )
-                elif func_code == 4:
-                    response = self.client.read_input_registers(
-                        address=address, count=count, slave=self.config.slave_id
-                    )
-                else:
-                    return OperationResult(False, error=f"不支持的功能码: {func_code}")
-                
-                if response.isError():
-                    return OperationResult(False, error=f"读取{data_type}失败: {response}")
-                
-                # 提取数据
-                if func_code in [1, 2]:
-                    data = response.bits[:count]
-                else:
-                    data = response.registers[:count]
-                
-                return OperationResult(True, data={
-                    "address": address,
-                    "count": count,
-                    "values": data
-                })
-                
-            except Exception as e:
-                return OperationResult(False, error=f"读取{data_type}异常: {str(e)}")
+        entry = self._READ_FUNCS.get(func_code)
+        if entry is None:
+            return OperationResult(False, error=f"不支持的功能码: {func_code}")
+        method_name, data_attr, data_type, _ = entry
+        
+        try:
+            response, is_error = self._transact(method_name, address=address, count=count)
+        except _NotConnected:
+            raise
+        except Exception as e:
+            # 异常信息带上数据类型，便于区分是哪一类读取出错
+            return OperationResult(False, error=f"读取{data_type}异常: {str(e)}")
+        if is_error:
+            return OperationResult(False, error=f"读取{data_type}失败: {response}")
+        
+        # 提取数据：寄存器响应长度与请求一致时直接复用，
+        # 只有按字节补齐的位数据才需要截断
+        data = getattr(response, data_attr)
+        if len(data) != count:
+            data = data[:count]
+        
+        return OperationResult(True, data=ReadPayload(address, count, data))
 
 
 class DeviceManager:
@@ -312,8 +526,17 @@ class DeviceManager:
     
     def __init__(self):
         """初始化设备管理器"""
+        # 设备字典采用写时复制：只在 add/remove 中（持锁）整体替换，
+        # 读取方直接读取当前引用，依赖 CPython 属性读取的原子性
         self.devices: Dict[str, ModbusDevice] = {}
         self.lock = threading.Lock()
+        
+        # 共享 TCP 连接池 {(host, port, timeout): 共享客户端}
+        self._tcp_pool: Dict[Tuple[str, int, float], _PooledTcpClient] = {}
+        self.pool_lock = threading.Lock()
+        
+        # 共享线程池，首次提交任务时创建
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def add_device(self, config: DeviceConfig) -> OperationResult:
         """
@@ -329,8 +552,11 @@ class DeviceManager:
             if config.device_id in self.devices:
                 return OperationResult(False, error=f"设备 ID {config.device_id} 已存在")
             
-            device = ModbusDevice(config)
-            self.devices[config.device_id] = device
+            device = ModbusDevice(config, self)
+            # 写时复制：构建新字典后整体替换，读取方无需加锁
+            devices = dict(self.devices)
+            devices[config.device_id] = device
+            self.devices = devices
             return OperationResult(True, data=f"设备 {config.name} 添加成功")
     
     def remove_device(self, device_id: str) -> OperationResult:
@@ -351,9 +577,82 @@ class DeviceManager:
             if device.connected:
                 device.disconnect()
             
-            del self.devices[device_id]
+            self.devices = {k: v for k, v in self.devices.items() if k != device_id}
             return OperationResult(True, data="设备移除成功")
     
+    def update_device(self, config: DeviceConfig) -> OperationResult:
+        """
+        更新已有设备的配置
+        
+        连接参数未变化时保留现有连接，只替换配置；变化时先断开，由用户重新连接。
+        
+        Args:
+            config: 新的设备配置（device_id 与已有设备一致）
+            
+        Returns:
+            操作结果
+        """
+        with self.lock:
+            device = self.devices.get(config.device_id)
+            if device is None:
+                return OperationResult(False, error=f"设备 ID {config.device_id} 不存在")
+            
+            old_config = device.config
+            if device.connected and _transport_key(old_config) != _transport_key(config):
+                device.disconnect()
+            
+            with device.lock:
+                device.config = config
+                # 从站地址变化时重新绑定请求方法
+                if device.connected and config.slave_id != old_config.slave_id:
+                    device._bind_requests()
+            return OperationResult(True, data=f"设备 {config.name} 更新成功")
+    
+    def acquire_tcp_client(self, config: DeviceConfig) -> Tuple[Tuple[str, int, float], ModbusTcpClient, threading.Lock]:
+        """
+        获取共享的 TCP 客户端，引用计数加一
+        
+        同一网关后的多个从站共用一个 socket，请求通过共享锁串行化。
+        
+        Args:
+            config: 设备配置
+            
+        Returns:
+            (连接池键, 客户端, 客户端请求锁)
+        """
+        key = (config.host, config.tcp_port, config.timeout)
+        with self.pool_lock:
+            entry = self._tcp_pool.get(key)
+            if entry is None:
+                client = ModbusTcpClient(
+                    host=config.host,
+                    port=config.tcp_port,
+                    timeout=config.timeout
+                )
+                entry = _PooledTcpClient(client, threading.Lock())
+                self._tcp_pool[key] = entry
+            entry.refcount += 1
+            return key, entry.client, entry.lock
+    
+    def release_tcp_client(self, key: Tuple[str, int, float]) -> None:
+        """
+        释放共享的 TCP 客户端，引用计数归零时关闭连接
+        
+        Args:
+            key: 连接池键
+        """
+        with self.pool_lock:
+            entry = self._tcp_pool.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            del self._tcp_pool[key]
+        
+        with entry.lock:
+            entry.client.close()
+    
     def get_device(self, device_id: str) -> Optional[ModbusDevice]:
         """
         获取设备
@@ -371,7 +670,7 @@ class DeviceManager:
         获取所有设备
         
         Returns:
-            设备列表
+            设备列表（快照，不受之后的增删影响）
         """
         return list(self.devices.values())
     
@@ -407,8 +706,140 @@ class DeviceManager:
         
         return device.disconnect()
     
-    def disconnect_all(self) -> None:
-        """断开所有设备连接"""
-        for device in self.devices.values():
-            if device.connected:
-                device.disconnect()
+    def connect_all(self) -> Dict[str, OperationResult]:
+        """
+        并发连接所有未连接的设备
+        
+        Returns:
+            {设备ID: 操作结果}
+        """
+        devices = [d for d in self.get_all_devices() if not d.connected]
+        return self._run_parallel(devices, ModbusDevice.connect)
+    
+    def disconnect_all(self) -> Dict[str, OperationResult]:
+        """
+        并发断开所有设备连接
+        
+        Returns:
+            {设备ID: 操作结果}
+        """
+        devices = [d for d in self.get_all_devices() if d.connected]
+        results = self._run_parallel(devices, ModbusDevice.disconnect)
+        self.shutdown_executor()
+        return results
+    
+    def submit_read(self, device_id: str, func_code: int, address: int, count: int) -> Future:
+        """
+        在共享线程池中异步读取 (功能码 01-04)
+        
+        Args:
+            device_id: 设备ID
+            func_code: 功能码
+            address: 起始地址
+            count: 读取数量
+            
+        Returns:
+            结果为 OperationResult 的 Future
+        """
+        return self._submit(device_id, ModbusDevice._read_operation, func_code, address, count)
+    
+    def submit_read_coils(self, device_id: str, address: int, count: int) -> Future:
+        """异步读取线圈 (功能码 01)"""
+        return self._submit(device_id, ModbusDevice.read_coils, address, count)
+    
+    def submit_read_discrete_inputs(self, device_id: str, address: int, count: int) -> Future:
+        """异步读取离散输入 (功能码 02)"""
+        return self._submit(device_id, ModbusDevice.read_discrete_inputs, address, count)
+    
+    def submit_read_holding_registers(self, device_id: str, address: int, count: int) -> Future:
+        """异步读取保持寄存器 (功能码 03)"""
+        return self._submit(device_id, ModbusDevice.read_holding_registers, address, count)
+    
+    def submit_read_input_registers(self, device_id: str, address: int, count: int) -> Future:
+        """异步读取输入寄存器 (功能码 04)"""
+        return self._submit(device_id, ModbusDevice.read_input_registers, address, count)
+    
+    def submit_write_coil(self, device_id: str, address: int, value: bool) -> Future:
+        """异步写单个线圈 (功能码 05)"""
+        return self._submit(device_id, ModbusDevice.write_single_coil, address, value)
+    
+    def submit_write_register(self, device_id: str, address: int, value: int) -> Future:
+        """异步写单个寄存器 (功能码 06)"""
+        return self._submit(device_id, ModbusDevice.write_single_register, address, value)
+    
+    def submit_write_coils(self, device_id: str, address: int, values: List[bool]) -> Future:
+        """异步写多个线圈 (功能码 15)"""
+        return self._submit(device_id, ModbusDevice.write_multiple_coils, address, values)
+    
+    def submit_write_registers(self, device_id: str, address: int, values: List[int]) -> Future:
+        """异步写多个寄存器 (功能码 16)"""
+        return self._submit(device_id, ModbusDevice.write_multiple_registers, address, values)
+    
+    def shutdown_executor(self) -> None:
+        """关闭共享线程池（已提交的任务继续执行，下次提交时重新创建）"""
+        with self.lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """获取共享线程池，不存在时创建"""
+        with self.lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix='modbus'
+                )
+            return self._executor
+    
+    def _submit(self, device_id: str, operation, *args) -> Future:
+        """
+        提交设备操作到共享线程池
+        
+        Args:
+            device_id: 设备ID
+            operation: 设备操作（ModbusDevice 的未绑定方法）
+            *args: 操作参数
+            
+        Returns:
+            结果为 OperationResult 的 Future
+        """
+        def run() -> OperationResult:
+            device = self.get_device(device_id)
+            if not device:
+                return OperationResult(False, error=f"设备 ID {device_id} 不存在")
+            return operation(device, *args)
+        
+        return self._get_executor().submit(run)
+    
+    def _run_parallel(self, devices: List[ModbusDevice], operation) -> Dict[str, OperationResult]:
+        """
+        在线程池中并发执行设备操作
+        
+        每个设备拥有独立的锁和客户端，阻塞的串口/网络 I/O 可以重叠执行，
+        总耗时由各设备耗时之和降为其中最大值。
+        
+        Args:
+            devices: 设备列表
+            operation: 设备操作（ModbusDevice 的未绑定方法）
+            
+        Returns:
+            {设备ID: 操作结果}
+        """
+        results: Dict[str, OperationResult] = {}
+        if not devices:
+            return results
+        
+        executor = self._get_executor()
+        futures = {
+            executor.submit(operation, device): device.config.device_id
+            for device in devices
+        }
+        for future in as_completed(futures):
+            device_id = futures[future]
+            try:
+                results[device_id] = future.result()
+            except Exception as e:
+                results[device_id] = OperationResult(False, error=str(e))
+        
+        return results
@@ -3,12 +3,19 @@ Excel 配置文件导入导出功能
 支持设备配置的导入和导出
 """
 from typing import List, Dict, Any
-import pandas as pd
+import io
 from pathlib import Path
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 
 from .device_manager import DeviceConfig, ConnectionType, OperationResult
+from .excel_utils import set_column_widths
+
+
+def _has_value(value: Any) -> bool:
+    """单元格是否有值（None 和空字符串视为空）"""
+    return value is not None and value != ''
 
 
 class ExcelManager:
@@ -21,6 +28,9 @@ class ExcelManager:
         'IP地址', 'TCP端口', '超时时间(秒)'
     ]
     
+    # 表头命名样式名称
+    HEADER_STYLE = "header"
+    
     def __init__(self):
         """初始化 Excel 管理器"""
         pass
@@ -37,56 +47,20 @@ class ExcelManager:
             操作结果
         """
         try:
-            # 创建工作簿
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "设备配置"
+            # 一次性构建所有行数据
+            rows = [self._device_to_row(device) for device in devices]
             
-            # 设置表头样式
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
+            # 使用只写模式流式写入，内存占用与行数无关
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("设备配置")
             
-            # 写入表头
-            for col_idx, col_name in enumerate(self.COLUMNS, start=1):
-                cell = ws.cell(row=1, column=col_idx, value=col_name)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
+            # 根据数据计算列宽（只写模式无法回读单元格）
+            set_column_widths(ws, self.COLUMNS, rows)
             
-            # 写入数据
-            for row_idx, device in enumerate(devices, start=2):
-                ws.cell(row=row_idx, column=1, value=device.device_id)
-                ws.cell(row=row_idx, column=2, value=device.name)
-                ws.cell(row=row_idx, column=3, value=device.connection_type.value)
-                ws.cell(row=row_idx, column=4, value=device.slave_id)
-                
-                # RTU 配置
-                ws.cell(row=row_idx, column=5, value=device.port or "")
-                ws.cell(row=row_idx, column=6, value=device.baudrate)
-                ws.cell(row=row_idx, column=7, value=device.bytesize)
-                ws.cell(row=row_idx, column=8, value=device.parity)
-                ws.cell(row=row_idx, column=9, value=device.stopbits)
-                
-                # TCP 配置
-                ws.cell(row=row_idx, column=10, value=device.host or "")
-                ws.cell(row=row_idx, column=11, value=device.tcp_port)
-                
-                # 通用配置
-                ws.cell(row=row_idx, column=12, value=device.timeout)
-            
-            # 自动调整列宽
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+            # 写入表头和数据
+            ws.append(self._header_cells(ws, self.COLUMNS))
+            for row in rows:
+                ws.append(row)
             
             # 保存文件
             wb.save(file_path)
@@ -95,6 +69,50 @@ class ExcelManager:
         except Exception as e:
             return OperationResult(False, error=f"导出失败: {str(e)}")
     
+    @staticmethod
+    def _device_to_row(device: DeviceConfig) -> tuple:
+        """将设备配置转换为 Excel 行数据（与 COLUMNS 顺序一致）"""
+        return (
+            device.device_id,
+            device.name,
+            device.connection_type.value,
+            device.slave_id,
+            # RTU 配置
+            device.port or "",
+            device.baudrate,
+            device.bytesize,
+            device.parity,
+            device.stopbits,
+            # TCP 配置
+            device.host or "",
+            device.tcp_port,
+            # 通用配置
+            device.timeout,
+        )
+    
+    @classmethod
+    def _header_cells(cls, ws, columns: List[str]) -> List[WriteOnlyCell]:
+        """
+        创建带样式的表头单元格
+        
+        表头样式作为命名样式在工作簿中注册一次，每个单元格只需引用样式名。
+        """
+        wb = ws.parent
+        if cls.HEADER_STYLE not in wb.named_styles:
+            wb.add_named_style(NamedStyle(
+                name=cls.HEADER_STYLE,
+                font=Font(bold=True, color="FFFFFF"),
+                fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+                alignment=Alignment(horizontal="center", vertical="center")
+            ))
+        
+        cells = []
+        for col_name in columns:
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.style = cls.HEADER_STYLE
+            cells.append(cell)
+        return cells
+    
     def import_devices(self, file_path: str) -> OperationResult:
         """
         从 Excel 文件导入设备配置
@@ -110,71 +128,87 @@ class ExcelManager:
             if not Path(file_path).exists():
                 return OperationResult(False, error="文件不存在")
             
-            # 读取 Excel 文件
-            df = pd.read_excel(file_path, sheet_name="设备配置")
-            
-            # 验证列名
-            required_columns = self.COLUMNS
-            missing_columns = set(required_columns) - set(df.columns)
-            if missing_columns:
-                return OperationResult(
-                    False, 
-                    error=f"Excel 文件缺少必需的列: {', '.join(missing_columns)}"
-                )
-            
-            devices = []
-            errors = []
-            
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    # 解析连接类型
-                    conn_type_str = str(row['连接类型']).strip().upper()
-                    if conn_type_str == "RTU":
-                        connection_type = ConnectionType.RTU
-                    elif conn_type_str == "TCP":
-                        connection_type = ConnectionType.TCP
-                    else:
-                        errors.append(f"第 {idx+2} 行: 无效的连接类型 '{conn_type_str}'")
-                        continue
-                    
-                    # 创建设备配置
-                    config = DeviceConfig(
-                        device_id=str(row['设备ID']).strip(),
-                        name=str(row['设备名称']).strip(),
-                        connection_type=connection_type,
-                        slave_id=int(row['从站地址']),
-                        timeout=float(row['超时时间(秒)']) if pd.notna(row['超时时间(秒)']) else 3.0
+            # 以只读模式流式读取 Excel 文件
+            wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                if "设备配置" not in wb.sheetnames:
+                    return OperationResult(False, error="Excel 文件缺少工作表: 设备配置")
+                rows = wb["设备配置"].iter_rows(values_only=True)
+                
+                # 解析表头，建立列名到索引的映射
+                header = next(rows, ())
+                col_idx = {str(name).strip(): i for i, name in enumerate(header) if name is not None}
+                
+                # 验证列名
+                required_columns = self.COLUMNS
+                missing_columns = set(required_columns) - set(col_idx)
+                if missing_columns:
+                    return OperationResult(
+                        False, 
+                        error=f"Excel 文件缺少必需的列: {', '.join(missing_columns)}"
                     )
-                    
-                    # RTU 配置
-                    if connection_type == ConnectionType.RTU:
-                        config.port = str(row['串口端口']).strip() if pd.notna(row['串口端口']) else None
-                        config.baudrate = int(row['波特率']) if pd.notna(row['波特率']) else 9600
-                        config.bytesize = int(row['数据位']) if pd.notna(row['数据位']) else 8
-                        config.parity = str(row['校验位']).strip() if pd.notna(row['校验位']) else 'N'
-                        config.stopbits = int(row['停止位']) if pd.notna(row['停止位']) else 1
-                        
-                        if not config.port:
-                            errors.append(f"第 {idx+2} 行: RTU 设备缺少串口端口")
+                
+                # 只取用到的列
+                used_idx = [(name, col_idx[name]) for name in required_columns]
+                
+                devices = []
+                errors = io.StringIO()  # 逐行写入错误信息
+                
+                # 解析每一行
+                for row_num, values in enumerate(rows, start=2):
+                    if all(v is None for v in values):
+                        continue
+                    row = {name: values[i] if i < len(values) else None for name, i in used_idx}
+                    try:
+                        # 解析连接类型
+                        conn_type_str = str(row['连接类型']).strip().upper()
+                        if conn_type_str == "RTU":
+                            connection_type = ConnectionType.RTU
+                        elif conn_type_str == "TCP":
+                            connection_type = ConnectionType.TCP
+                        else:
+                            errors.write(f"第 {row_num} 行: 无效的连接类型 '{conn_type_str}'\n")
                             continue
-                    
-                    # TCP 配置
-                    elif connection_type == ConnectionType.TCP:
-                        config.host = str(row['IP地址']).strip() if pd.notna(row['IP地址']) else None
-                        config.tcp_port = int(row['TCP端口']) if pd.notna(row['TCP端口']) else 502
                         
-                        if not config.host:
-                            errors.append(f"第 {idx+2} 行: TCP 设备缺少IP地址")
-                            continue
-                    
-                    devices.append(config)
-                    
-                except Exception as e:
-                    errors.append(f"第 {idx+2} 行解析错误: {str(e)}")
+                        # 创建设备配置
+                        config = DeviceConfig(
+                            device_id=str(row['设备ID']).strip(),
+                            name=str(row['设备名称']).strip(),
+                            connection_type=connection_type,
+                            slave_id=int(row['从站地址']),
+                            timeout=float(row['超时时间(秒)']) if _has_value(row['超时时间(秒)']) else 3.0
+                        )
+                        
+                        # RTU 配置
+                        if connection_type == ConnectionType.RTU:
+                            config.port = str(row['串口端口']).strip() if _has_value(row['串口端口']) else None
+                            config.baudrate = int(row['波特率']) if _has_value(row['波特率']) else 9600
+                            config.bytesize = int(row['数据位']) if _has_value(row['数据位']) else 8
+                            config.parity = str(row['校验位']).strip() if _has_value(row['校验位']) else 'N'
+                            config.stopbits = int(row['停止位']) if _has_value(row['停止位']) else 1
+                            
+                            if not config.port:
+                                errors.write(f"第 {row_num} 行: RTU 设备缺少串口端口\n")
+                                continue
+                        
+                        # TCP 配置
+                        elif connection_type == ConnectionType.TCP:
+                            config.host = str(row['IP地址']).strip() if _has_value(row['IP地址']) else None
+                            config.tcp_port = int(row['TCP端口']) if _has_value(row['TCP端口']) else 502
+                            
+                            if not config.host:
+                                errors.write(f"第 {row_num} 行: TCP 设备缺少IP地址\n")
+                                continue
+                        
+                        devices.append(config)
+                        
+                    except Exception as e:
+                        errors.write(f"第 {row_num} 行解析错误: {str(e)}\n")
+            finally:
+                wb.close()
             
-            if errors:
-                error_msg = "\n".join(errors)
+            error_msg = errors.getvalue().rstrip("\n")
+            if error_msg:
                 if not devices:
                     return OperationResult(False, error=f"导入失败:\n{error_msg}")
                 else:
@@ -243,35 +277,22 @@ class ExcelManager:
             操作结果
         """
         try:
-            df = pd.DataFrame(log_data)
+            # 列名按首次出现顺序收集，缺失的字段留空
+            columns = list(dict.fromkeys(key for entry in log_data for key in entry))
+            rows = [tuple(entry.get(key) for key in columns) for entry in log_data]
             
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='操作日志', index=False)
-                
-                # 获取工作表
-                workbook = writer.book
-                worksheet = writer.sheets['操作日志']
-                
-                # 设置表头样式
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
-                
-                # 自动调整列宽
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("操作日志")
+            
+            # 根据数据计算列宽
+            set_column_widths(ws, columns, rows)
+            
+            # 写入表头和数据
+            ws.append(self._header_cells(ws, columns))
+            for row in rows:
+                ws.append(row)
+            
+            wb.save(file_path)
             
             return OperationResult(True, data=f"成功导出 {len(log_data)} 条日志")
             
@@ -0,0 +1,42 @@
+"""
+Excel 导出公共工具
+设备配置与寄存器点表导出共用
+"""
+from typing import Dict, List, Optional
+
+from openpyxl.utils import get_column_letter
+
+
+def set_column_widths(ws, columns: List[str], rows: List[tuple],
+                      fixed_widths: Optional[Dict[int, int]] = None) -> None:
+    """
+    根据表头和行数据设置列宽
+    
+    列宽在写入前由内存中的数据按列求最大值得到，只写模式下无需回读单元格。
+    
+    Args:
+        ws: 工作表
+        columns: 表头
+        rows: 行数据（与表头顺序一致）
+        fixed_widths: {列索引: 宽度}，取值位数有上限的列直接使用该宽度而不逐行计算
+    """
+    fixed_widths = fixed_widths or {}
+    
+    # 以表头宽度为初值，逐行累积每列最大宽度
+    widths = [len(str(h)) for h in columns]
+    for i, width in fixed_widths.items():
+        widths[i] = max(widths[i], width)
+    measured = [i for i in range(len(columns)) if i not in fixed_widths]
+    
+    for row in rows:
+        for i in measured:
+            v = row[i]
+            if v is None:
+                continue
+            # 文本直接取长度，仅数值需要转换为字符串
+            n = len(v) if v.__class__ is str else len(str(v))
+            if n > widths[i]:
+                widths[i] = n
+    
+    for col_idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
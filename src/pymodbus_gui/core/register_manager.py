@@ -2,15 +2,50 @@
 寄存器点表管理器
 负责管理 Modbus Slave 的寄存器点表配置
 """
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import List, Dict, Optional, Any, Set, Tuple, Iterator
+from functools import lru_cache
+from operator import attrgetter
+import os
 from pathlib import Path
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
+from .excel_utils import set_column_widths
 from .slave_server import RegisterPoint, OperationResult
 
 
+# 点位排序键
+_ADDR_KEY = attrgetter('address')
+
+
+class _SheetFormatError(Exception):
+    """点表工作表结构不符合要求（缺少工作表或必需列）"""
+
+
+def _save_workbook(wb: Workbook, file_path: str) -> None:
+    """
+    先保存到同目录临时文件再原子替换目标文件，保存失败时不会留下写了一半的文件
+    
+    Args:
+        wb: 工作簿
+        file_path: 目标文件路径
+    """
+    tmp_path = f"{file_path}.tmp"
+    try:
+        wb.save(tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _has_value(value: Any) -> bool:
+    """单元格是否有值（None 和空字符串视为空）"""
+    return value is not None and value != ''
+
+
 class RegisterManager:
     """寄存器点表管理器"""
     
@@ -20,18 +55,10 @@ class RegisterManager:
         '单位', '最小值', '最大值', '只读'
     ]
     
-    # 寄存器类型映射
-    REGISTER_TYPES = {
-        '线圈': 'coil',
-        '离散输入': 'discrete_input',
-        '保持寄存器': 'holding_register',
-        '输入寄存器': 'input_register',
-        'coil': 'coil',
-        'discrete_input': 'discrete_input',
-        'holding_register': 'holding_register',
-        'input_register': 'input_register'
-    }
+    # 取值位数有上限的列，直接使用固定宽度而不逐行计算（地址 0-65535 最多 5 位）
+    _FIXED_WIDTHS = {0: 5}
     
+    # 寄存器类型 -> 中文名称
     REGISTER_TYPES_CN = {
         'coil': '线圈',
         'discrete_input': '离散输入',
@@ -39,6 +66,44 @@ class RegisterManager:
         'input_register': '输入寄存器'
     }
     
+    # 寄存器类型映射（中文名称和类型名本身均映射到类型名）
+    REGISTER_TYPES = {
+        key: reg_type
+        for reg_type, cn_name in REGISTER_TYPES_CN.items()
+        for key in (cn_name, reg_type)
+    }
+    
+    # 寄存器类型 -> 按列导出时使用的整数编码
+    TYPE_CODES = {
+        'coil': 0,
+        'discrete_input': 1,
+        'holding_register': 2,
+        'input_register': 3
+    }
+    
+    # points_to_columns 的列定义（numpy 结构化数组字段）
+    _COLUMN_DTYPE = [
+        ('address', 'u2'),
+        ('type_code', 'i1'),
+        ('value', 'i4'),
+        ('min_value', 'f8'),
+        ('max_value', 'f8'),
+        ('read_only', '?'),
+        ('name', 'O'),
+    ]
+    
+    # 位类型寄存器
+    _BOOL_TYPES = frozenset({'coil', 'discrete_input'})
+    
+    # 视为真值的文本
+    _TRUE_STRINGS = frozenset({'true', '是', '1', 'on', 'yes'})
+    
+    # 表头和说明标题样式（模块加载时创建一次，各次导出共用）
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    _HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+    _TITLE_FONT = Font(bold=True, size=14)
+    
     def __init__(self):
         """初始化寄存器管理器"""
         pass
@@ -55,55 +120,63 @@ class RegisterManager:
             操作结果
         """
         try:
-            # 创建工作簿
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "寄存器点表"
+            # 一次性构建所有行数据
+            rows = list(map(self._point_to_row, points))
             
-            # 设置表头样式
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 写入表头
-            for col_idx, col_name in enumerate(self.COLUMNS, start=1):
-                cell = ws.cell(row=1, column=col_idx, value=col_name)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-            
-            # 写入数据
-            for row_idx, point in enumerate(points, start=2):
-                ws.cell(row=row_idx, column=1, value=point.address)
-                ws.cell(row=row_idx, column=2, value=point.name)
-                ws.cell(row=row_idx, column=3, value=self.REGISTER_TYPES_CN.get(point.register_type, point.register_type))
-                ws.cell(row=row_idx, column=4, value=point.value)
-                ws.cell(row=row_idx, column=5, value=point.description)
-                ws.cell(row=row_idx, column=6, value=point.unit)
-                ws.cell(row=row_idx, column=7, value=point.min_value if point.min_value is not None else "")
-                ws.cell(row=row_idx, column=8, value=point.max_value if point.max_value is not None else "")
-                ws.cell(row=row_idx, column=9, value="是" if point.read_only else "否")
-            
-            # 自动调整列宽
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+            # 使用只写模式流式写入，内存占用与行数无关
+            wb = Workbook(write_only=True)
+            self._write_table(wb.create_sheet("寄存器点表"), rows)
             
             # 保存文件
-            wb.save(file_path)
+            _save_workbook(wb, file_path)
             return OperationResult(True, data=f"成功导出 {len(points)} 个寄存器点位")
             
         except Exception as e:
             return OperationResult(False, error=f"导出失败: {str(e)}")
     
+    def _write_table(self, ws, rows: List[tuple]) -> None:
+        """
+        向只写工作表写入表头和数据行
+        
+        列宽须在写入第一行之前设置，因此先由行数据计算列宽再逐行追加。
+        
+        Args:
+            ws: 只写工作表
+            rows: 行数据（与 COLUMNS 顺序一致）
+        """
+        set_column_widths(ws, self.COLUMNS, rows, self._FIXED_WIDTHS)
+        
+        append = ws.append
+        append(self._header_cells(ws, self.COLUMNS))
+        for row in rows:
+            append(row)
+    
+    def _point_to_row(self, point: RegisterPoint) -> tuple:
+        """将寄存器点位转换为 Excel 行数据（与 COLUMNS 顺序一致）"""
+        return (
+            point.address,
+            point.name,
+            self.REGISTER_TYPES_CN.get(point.register_type, point.register_type),
+            point.value,
+            point.description,
+            point.unit,
+            point.min_value if point.min_value is not None else "",
+            point.max_value if point.max_value is not None else "",
+            "是" if point.read_only else "否",
+        )
+    
+    @classmethod
+    def _header_cells(cls, ws, columns: List[str]) -> List[WriteOnlyCell]:
+        """创建带样式的表头单元格"""
+        cells = []
+        for col_name in columns:
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.font = cls._HEADER_FONT
+            cell.fill = cls._HEADER_FILL
+            cell.alignment = cls._HEADER_ALIGN
+            cells.append(cell)
+        return cells
+    
     def import_register_points(self, file_path: str) -> OperationResult:
         """
         从 Excel 导入寄存器点表
@@ -119,84 +192,178 @@ class RegisterManager:
             if not Path(file_path).exists():
                 return OperationResult(False, error="文件不存在")
             
-            # 读取 Excel 文件
-            df = pd.read_excel(file_path, sheet_name="寄存器点表")
+            points = []
+            errors = []
+            for point, error in self._iter_points(file_path):
+                if point is not None:
+                    points.append(point)
+                else:
+                    errors.append(error)
+            
+            if errors:
+                error_msg = "\n".join(errors)
+                if not points:
+                    return OperationResult(False, error=f"导入失败:\n{error_msg}")
+                else:
+                    return OperationResult(
+                        True, 
+                        data=points,
+                        error=f"部分行导入失败:\n{error_msg}"
+                    )
+            
+            return OperationResult(True, data=points)
+            
+        except _SheetFormatError as e:
+            return OperationResult(False, error=str(e))
+        except Exception as e:
+            return OperationResult(False, error=f"导入失败: {str(e)}")
+    
+    def import_as_columns(self, file_path: str) -> OperationResult:
+        """
+        从 Excel 导入寄存器点表，按列返回 numpy 数组
+        
+        Args:
+            file_path: Excel 文件路径
+            
+        Returns:
+            操作结果，成功时 data 为 points_to_columns 的返回值
+        """
+        result = self.import_register_points(file_path)
+        if result.data is None:
+            return result
+        try:
+            columns = self.points_to_columns(result.data)
+        except (OverflowError, ValueError) as e:
+            return OperationResult(False, error=f"导入失败: {str(e)}")
+        return OperationResult(True, data=columns, error=result.error)
+    
+    def points_to_columns(self, points: List[RegisterPoint]) -> Dict[str, Any]:
+        """
+        将点位列表转换为按列存储的 numpy 数组，便于批量初始化寄存器
+        
+        Args:
+            points: 寄存器点位列表
+            
+        Returns:
+            列名到数组的字典：address(uint16)、type_code(int8，见 TYPE_CODES)、
+            value(int32)、min_value/max_value(float64，未设置为 NaN)、
+            read_only(bool)、name(object)
+        """
+        import numpy as np
+        
+        # 一次遍历点位填充结构化数组，各列为其字段视图
+        type_codes = self.TYPE_CODES
+        nan = float('nan')
+        table = np.fromiter(
+            ((p.address, type_codes[p.register_type], p.value,
+              nan if p.min_value is None else p.min_value,
+              nan if p.max_value is None else p.max_value,
+              p.read_only, p.name) for p in points),
+            dtype=self._COLUMN_DTYPE, count=len(points)
+        )
+        return {name: table[name] for name in table.dtype.names}
+    
+    def _iter_points(self, file_path: str) -> Iterator[Tuple[Optional[RegisterPoint], Optional[str]]]:
+        """
+        逐行解析寄存器点表，不在内存中保留整张点表
+        
+        每行产出 (点位, None) 或 (None, 错误信息)。工作表或必需列缺失时
+        抛出 _SheetFormatError。
+        
+        Args:
+            file_path: Excel 文件路径
+            
+        Yields:
+            (寄存器点位, 错误信息)
+        """
+        # 以只读模式流式读取 Excel 文件
+        wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            if "寄存器点表" not in wb.sheetnames:
+                raise _SheetFormatError("Excel 文件缺少工作表: 寄存器点表")
+            rows = wb["寄存器点表"].iter_rows(values_only=True)
+            
+            # 解析表头，建立列名到索引的映射
+            header = next(rows, ())
+            col_idx = {str(name).strip(): i for i, name in enumerate(header) if name is not None}
             
             # 验证列名
             required_columns = self.COLUMNS
-            missing_columns = set(required_columns) - set(df.columns)
+            missing_columns = set(required_columns) - set(col_idx)
             if missing_columns:
-                return OperationResult(
-                    False, 
-                    error=f"Excel 文件缺少必需的列: {', '.join(missing_columns)}"
-                )
+                raise _SheetFormatError(f"Excel 文件缺少必需的列: {', '.join(missing_columns)}")
             
-            points = []
-            errors = []
+            # 各列在行元组中的位置
+            (i_addr, i_name, i_type, i_value, i_desc,
+             i_unit, i_min, i_max, i_ro) = (col_idx[c] for c in self.COLUMNS)
+            width = max(col_idx.values()) + 1
+            
+            bool_types = self._BOOL_TYPES
+            true_strings = self._TRUE_STRINGS
+            make_point = RegisterPoint._make
             
             # 解析每一行
-            for idx, row in df.iterrows():
+            for row_num, row in enumerate(rows, start=2):
+                if all(v is None for v in row):
+                    continue
+                if len(row) < width:
+                    row = row + (None,) * (width - len(row))
                 try:
                     # 解析寄存器类型
-                    reg_type_str = str(row['寄存器类型']).strip()
-                    register_type = self.REGISTER_TYPES.get(reg_type_str)
+                    register_type = _normalize_register_type(row[i_type])
                     
                     if not register_type:
-                        errors.append(f"第 {idx+2} 行: 无效的寄存器类型 '{reg_type_str}'")
+                        yield None, f"第 {row_num} 行: 无效的寄存器类型 '{str(row[i_type]).strip()}'"
                         continue
                     
                     # 解析值
-                    value = row['初始值']
-                    if pd.isna(value):
+                    value = row[i_value]
+                    if not _has_value(value):
                         value = 0
-                    elif register_type in ['coil', 'discrete_input']:
+                    elif register_type in bool_types:
                         # 布尔类型处理
                         if isinstance(value, str):
-                            value = 1 if value.lower() in ['true', '是', '1', 'on'] else 0
+                            value = 1 if value.strip().lower() in true_strings else 0
                         else:
                             value = int(value)
                     else:
                         value = int(value)
+                    if not 0 <= value <= 65535:
+                        yield None, f"第 {row_num} 行: 初始值 {value} 超出范围 0-65535"
+                        continue
+                    
+                    # 解析地址
+                    address = int(row[i_addr])
+                    if not 0 <= address <= 65535:
+                        yield None, f"第 {row_num} 行: 地址 {address} 超出范围 0-65535"
+                        continue
                     
                     # 解析只读
                     read_only = False
-                    if pd.notna(row['只读']):
-                        read_only_str = str(row['只读']).strip().lower()
-                        read_only = read_only_str in ['true', '是', '1', 'yes']
+                    if _has_value(row[i_ro]):
+                        read_only_str = str(row[i_ro]).strip().lower()
+                        read_only = read_only_str in true_strings
                     
-                    # 创建点位配置
-                    point = RegisterPoint(
-                        address=int(row['地址']),
-                        name=str(row['点位名称']).strip(),
-                        register_type=register_type,
-                        value=value,
-                        description=str(row['描述']).strip() if pd.notna(row['描述']) else "",
-                        unit=str(row['单位']).strip() if pd.notna(row['单位']) else "",
-                        min_value=float(row['最小值']) if pd.notna(row['最小值']) else None,
-                        max_value=float(row['最大值']) if pd.notna(row['最大值']) else None,
-                        read_only=read_only
-                    )
-                    
-                    points.append(point)
+                    # 创建点位配置（字段顺序与 RegisterPoint 定义一致）
+                    point = make_point((
+                        address,
+                        str(row[i_name]).strip(),
+                        register_type,
+                        value,
+                        str(row[i_desc]).strip() if _has_value(row[i_desc]) else "",
+                        str(row[i_unit]).strip() if _has_value(row[i_unit]) else "",
+                        float(row[i_min]) if _has_value(row[i_min]) else None,
+                        float(row[i_max]) if _has_value(row[i_max]) else None,
+                        read_only
+                    ))
                     
                 except Exception as e:
-                    errors.append(f"第 {idx+2} 行解析错误: {str(e)}")
-            
-            if errors:
-                error_msg = "\n".join(errors)
-                if not points:
-                    return OperationResult(False, error=f"导入失败:\n{error_msg}")
-                else:
-                    return OperationResult(
-                        True, 
-                        data=points,
-                        error=f"部分行导入失败:\n{error_msg}"
-                    )
-            
-            return OperationResult(True, data=points)
-            
-        except Exception as e:
-            return OperationResult(False, error=f"导入失败: {str(e)}")
+                    yield None, f"第 {row_num} 行解析错误: {str(e)}"
+                    continue
+                
+                yield point, None
+        finally:
+            wb.close()
     
     def create_template(self, file_path: str) -> OperationResult:
         """
@@ -209,98 +376,21 @@ class RegisterManager:
             操作结果
         """
         try:
-            # 创建工作簿
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "寄存器点表"
+            # 使用只写模式创建工作簿
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("寄存器点表")
             
-            # 设置表头样式
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 写入表头
-            for col_idx, col_name in enumerate(self.COLUMNS, start=1):
-                cell = ws.cell(row=1, column=col_idx, value=col_name)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-            
-            # 写入示例数据
-            examples = [
-                {
-                    '地址': 0,
-                    '点位名称': '运行状态',
-                    '寄存器类型': '线圈',
-                    '初始值': 0,
-                    '描述': '设备运行状态',
-                    '单位': '',
-                    '最小值': '',
-                    '最大值': '',
-                    '只读': '否'
-                },
-                {
-                    '地址': 1,
-                    '点位名称': '故障报警',
-                    '寄存器类型': '离散输入',
-                    '初始值': 0,
-                    '描述': '设备故障报警',
-                    '单位': '',
-                    '最小值': '',
-                    '最大值': '',
-                    '只读': '是'
-                },
-                {
-                    '地址': 0,
-                    '点位名称': '温度设定',
-                    '寄存器类型': '保持寄存器',
-                    '初始值': 250,
-                    '描述': '温度设定值',
-                    '单位': '0.1°C',
-                    '最小值': 0,
-                    '最大值': 1000,
-                    '只读': '否'
-                },
-                {
-                    '地址': 1,
-                    '点位名称': '当前温度',
-                    '寄存器类型': '输入寄存器',
-                    '初始值': 235,
-                    '描述': '当前实际温度',
-                    '单位': '0.1°C',
-                    '最小值': 0,
-                    '最大值': 1000,
-                    '只读': '是'
-                },
-                {
-                    '地址': 2,
-                    '点位名称': '压力值',
-                    '寄存器类型': '输入寄存器',
-                    '初始值': 1013,
-                    '描述': '当前压力值',
-                    '单位': '0.1kPa',
-                    '最小值': 0,
-                    '最大值': 10000,
-                    '只读': '是'
-                }
+            # 示例数据（与 COLUMNS 顺序一致：地址, 点位名称, 寄存器类型, 初始值, 描述, 单位, 最小值, 最大值, 只读）
+            rows = [
+                (0, '运行状态', '线圈', 0, '设备运行状态', '', '', '', '否'),
+                (1, '故障报警', '离散输入', 0, '设备故障报警', '', '', '', '是'),
+                (0, '温度设定', '保持寄存器', 250, '温度设定值', '0.1°C', 0, 1000, '否'),
+                (1, '当前温度', '输入寄存器', 235, '当前实际温度', '0.1°C', 0, 1000, '是'),
+                (2, '压力值', '输入寄存器', 1013, '当前压力值', '0.1kPa', 0, 10000, '是'),
             ]
             
-            for row_idx, example in enumerate(examples, start=2):
-                for col_idx, col_name in enumerate(self.COLUMNS, start=1):
-                    ws.cell(row=row_idx, column=col_idx, value=example.get(col_name, ''))
-            
-            # 自动调整列宽
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+            # 写入表头和示例数据
+            self._write_table(ws, rows)
             
             # 添加说明工作表
             ws_info = wb.create_sheet("填写说明")
@@ -330,15 +420,16 @@ class RegisterManager:
                 "- 只读点位只能通过界面或程序修改，不能通过 Modbus 写入"
             ]
             
-            for row_idx, instruction in enumerate(instructions, start=1):
-                cell = ws_info.cell(row=row_idx, column=1, value=instruction)
-                if row_idx == 1:
-                    cell.font = Font(bold=True, size=14)
-            
             ws_info.column_dimensions['A'].width = 80
             
+            title_cell = WriteOnlyCell(ws_info, value=instructions[0])
+            title_cell.font = self._TITLE_FONT
+            ws_info.append([title_cell])
+            for instruction in instructions[1:]:
+                ws_info.append([instruction])
+            
             # 保存文件
-            wb.save(file_path)
+            _save_workbook(wb, file_path)
             return OperationResult(True, data="模板创建成功")
             
         except Exception as e:
@@ -357,34 +448,92 @@ class RegisterManager:
         errors = []
         
         # 检查地址重复
-        address_map: Dict[str, List[int]] = {
-            'coil': [],
-            'discrete_input': [],
-            'holding_register': [],
-            'input_register': []
+        address_map: Dict[str, Set[int]] = {
+            'coil': set(),
+            'discrete_input': set(),
+            'holding_register': set(),
+            'input_register': set()
         }
         
         for point in points:
-            if point.address in address_map[point.register_type]:
-                errors.append(
-                    f"地址冲突: {self.REGISTER_TYPES_CN[point.register_type]} "
-                    f"地址 {point.address} 重复定义"
-                )
-            else:
-                address_map[point.register_type].append(point.address)
-            
-            # 检查值的有效性
-            if not point.validate_value(point.value):
-                errors.append(
-                    f"点位 '{point.name}' (地址 {point.address}): "
-                    f"初始值 {point.value} 超出有效范围"
-                )
+            self._check_point(point, address_map, errors)
         
         if errors:
             return OperationResult(False, error="\n".join(errors))
         
         return OperationResult(True, data=f"验证通过，共 {len(points)} 个点位")
     
+    def validate_columns(self, columns: Dict[str, Any]) -> OperationResult:
+        """
+        验证按列存储的点位（points_to_columns 的返回值），检查逻辑与 validate_points 一致
+        
+        Args:
+            columns: 列名到数组的字典
+            
+        Returns:
+            操作结果
+        """
+        import numpy as np
+        
+        address = columns['address']
+        type_code = columns['type_code']
+        value = columns['value']
+        min_value = columns['min_value']
+        max_value = columns['max_value']
+        errors = []
+        
+        # 检查地址重复：(地址, 类型) 组合键出现多于一次即为冲突
+        key = (address.astype(np.int64) << 8) | type_code.astype(np.int64)
+        keys, counts = np.unique(key, return_counts=True)
+        code_to_type = {code: reg_type for reg_type, code in self.TYPE_CODES.items()}
+        for k, c in zip(keys[counts > 1].tolist(), counts[counts > 1].tolist()):
+            reg_type = code_to_type[k & 0xFF]
+            errors.extend(
+                [f"地址冲突: {self.REGISTER_TYPES_CN[reg_type]} 地址 {k >> 8} 重复定义"] * (c - 1)
+            )
+        
+        # 检查值的有效性：位类型只能为 0/1，寄存器受最小值/最大值约束
+        is_bool = (type_code == self.TYPE_CODES['coil']) | (type_code == self.TYPE_CODES['discrete_input'])
+        bad_bool = is_bool & (value != 0) & (value != 1)
+        below = ~is_bool & ~np.isnan(min_value) & (value < min_value)
+        above = ~is_bool & ~np.isnan(max_value) & (value > max_value)
+        name = columns['name']
+        errors.extend(
+            f"点位 '{name[i]}' (地址 {address[i]}): 初始值 {value[i]} 超出有效范围"
+            for i in np.flatnonzero(bad_bool | below | above).tolist()
+        )
+        
+        if errors:
+            return OperationResult(False, error="\n".join(errors))
+        
+        return OperationResult(True, data=f"验证通过，共 {len(address)} 个点位")
+    
+    def _check_point(self, point: RegisterPoint, address_map: Dict[str, Set[int]],
+                     errors: List[str]) -> None:
+        """
+        检查单个点位的地址冲突和初始值，错误信息追加到 errors
+        
+        Args:
+            point: 寄存器点位
+            address_map: 各寄存器类型已出现的地址
+            errors: 错误信息列表
+        """
+        seen = address_map[point.register_type]
+        if point.address in seen:
+            errors.append(
+                f"地址冲突: {self.REGISTER_TYPES_CN[point.register_type]} "
+                f"地址 {point.address} 重复定义"
+            )
+        else:
+            seen.add(point.address)
+        
+        # 检查值的有效性
+        if not point.validate_value(point.value):
+            errors.append(
+                f"点位 '{point.name}' (地址 {point.address}): "
+                f"初始值 {point.value} 超出有效范围"
+            )
+    
     def group_points_by_type(self, points: List[RegisterPoint]) -> Dict[str, List[RegisterPoint]]:
         """
         按寄存器类型分组点位
@@ -407,6 +556,58 @@ class RegisterManager:
         
         # 按地址排序
         for key in grouped:
-            grouped[key].sort(key=lambda p: p.address)
+            grouped[key].sort(key=_ADDR_KEY)
         
         return grouped
+    
+    def validate_and_group(self, points: List[RegisterPoint]) -> Tuple[OperationResult, Dict[str, List[RegisterPoint]]]:
+        """
+        单次遍历完成点位验证和按类型分组
+        
+        Args:
+            points: 寄存器点位列表
+            
+        Returns:
+            (验证结果, 按地址排序的分组字典)
+        """
+        errors = []
+        address_map: Dict[str, Set[int]] = {
+            'coil': set(),
+            'discrete_input': set(),
+            'holding_register': set(),
+            'input_register': set()
+        }
+        grouped: Dict[str, List[RegisterPoint]] = {
+            'coil': [],
+            'discrete_input': [],
+            'holding_register': [],
+            'input_register': []
+        }
+        
+        for point in points:
+            self._check_point(point, address_map, errors)
+            grouped[point.register_type].append(point)
+        
+        # 按地址排序
+        for group in grouped.values():
+            group.sort(key=_ADDR_KEY)
+        
+        if errors:
+            return OperationResult(False, error="\n".join(errors)), grouped
+        return OperationResult(True, data=f"验证通过，共 {len(points)} 个点位"), grouped
+
+
+@lru_cache(maxsize=256)
+def _normalize_register_type(value: Any) -> Optional[str]:
+    """
+    将单元格中的寄存器类型（中文名称或类型名）规范化为类型名
+    
+    点表中该列只有少数几种取值，缓存后重复值无需再做字符串转换和查表。
+    
+    Args:
+        value: 单元格原始值
+        
+    Returns:
+        类型名，无法识别时返回 None
+    """
+    return RegisterManager.REGISTER_TYPES.get(str(value).strip())
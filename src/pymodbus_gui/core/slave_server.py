@@ -2,15 +2,20 @@
 Modbus Slave 服务器
 支持 RTU 和 TCP，功能码 1-21，多设备并发
 """
-from typing import Dict, Optional, Any, List, Callable
+from typing import Dict, Optional, Any, List, Callable, Mapping, Tuple, Set
+from types import MappingProxyType
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 import threading
 import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache, partial
 import socket
 import struct
-from pathlib import Path
-from pymodbus.server import StartAsyncSerialServer, StartAsyncTcpServer
+from pymodbus.server import ModbusSerialServer, ModbusTcpServer
 from pymodbus.datastore import (
     ModbusSequentialDataBlock,
     ModbusSlaveContext,
@@ -18,6 +23,12 @@ from pymodbus.datastore import (
 )
 from pymodbus.device import ModbusDeviceIdentification
 import asyncio
+import numpy as np
+
+try:
+    import uvloop  # 可选依赖，未安装（如 Windows 下不可用）时使用默认事件循环
+except ImportError:
+    uvloop = None
 
 
 class SlaveConnectionType(Enum):
@@ -26,7 +37,60 @@ class SlaveConnectionType(Enum):
     TCP = "TCP"
 
 
-@dataclass
+# 设备标识常量
+_VENDOR_NAME = 'Pymodbus GUI'
+_PRODUCT_CODE = 'PM'
+_VENDOR_URL = 'https://github.com/pymodbus-dev/pymodbus/'
+_REVISION = '2.0.0'
+
+class RegisterType(IntEnum):
+    """寄存器类型（值为 SlaveContext 功能码）"""
+    COIL = 1
+    DISCRETE_INPUT = 2
+    HOLDING_REGISTER = 3
+    INPUT_REGISTER = 4
+
+
+# 寄存器类型 -> SlaveContext 功能码
+_RT_CODE = {
+    'coil': RegisterType.COIL,
+    'discrete_input': RegisterType.DISCRETE_INPUT,
+    'holding_register': RegisterType.HOLDING_REGISTER,
+    'input_register': RegisterType.INPUT_REGISTER
+}
+
+# 寄存器类型 -> get_all_values 结果键
+_VALUE_KEYS = {
+    'coil': 'coils',
+    'discrete_input': 'discrete_inputs',
+    'holding_register': 'holding_registers',
+    'input_register': 'input_registers'
+}
+
+# 位类型寄存器及其合法取值（True/False 与 1/0 哈希相同）
+_BIT_TYPES = frozenset({'coil', 'discrete_input'})
+_BIT_VALUES = frozenset({0, 1})
+
+# 日志窗口级别 -> logging 数值级别（SUCCESS 介于 INFO 和 WARNING 之间）
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'SUCCESS': logging.INFO + 5,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR
+}
+
+# 文件记录写入后延迟落盘的间隔（秒），期间的多次写入合并为一次
+_FILE_FLUSH_INTERVAL = 0.25
+
+# 文件记录读取缓存的最大条目数
+_READ_CACHE_SIZE = 256
+
+# 在共享事件循环中等待协程完成的默认超时（秒），循环线程异常退出时调用方不会永久阻塞
+_LOOP_CALL_TIMEOUT = 30.0
+
+
+@dataclass(slots=True, frozen=True)
 class RegisterPoint:
     """寄存器点位配置"""
     address: int  # 地址
@@ -39,19 +103,32 @@ class RegisterPoint:
     max_value: Optional[float] = None  # 最大值
     read_only: bool = False  # 只读
     
+    @classmethod
+    def _make(cls, row: tuple) -> 'RegisterPoint':
+        """
+        由按字段顺序排列的元组构造点位（位置参数，无关键字参数处理）
+        
+        Args:
+            row: (address, name, register_type, value, description, unit,
+                  min_value, max_value, read_only)
+        """
+        return cls(*row)
+    
+    def __post_init__(self):
+        # 构造时校验寄存器类型，配置错误在加载时即暴露
+        if self.register_type not in _RT_CODE:
+            raise ValueError(f"无效的寄存器类型: {self.register_type}")
+    
     def validate_value(self, value: Any) -> bool:
         """验证值是否在有效范围内"""
-        if self.register_type in ['coil', 'discrete_input']:
-            return isinstance(value, (bool, int)) and value in [0, 1, True, False]
+        if self.register_type in _BIT_TYPES:
+            return isinstance(value, int) and value in _BIT_VALUES
         
-        if self.min_value is not None and value < self.min_value:
-            return False
-        if self.max_value is not None and value > self.max_value:
-            return False
-        return True
+        lo, hi = self.min_value, self.max_value
+        return (lo is None or value >= lo) and (hi is None or value <= hi)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRecordConfig:
     """文件记录配置"""
     file_number: int  # 文件号
@@ -77,7 +154,7 @@ class FileRecordConfig:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class SlaveConfig:
     """Slave 配置数据类"""
     slave_id: str  # Slave 唯一标识
@@ -110,7 +187,7 @@ class SlaveConfig:
     enable_file_operations: bool = False  # 是否启用文件操作功能
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """操作结果数据类"""
     success: bool  # 操作是否成功
@@ -118,6 +195,285 @@ class OperationResult:
     error: Optional[str] = None  # 错误信息
 
 
+# get_all_values 返回数组的元素类型
+_POINT_VALUE_DTYPE = np.dtype([('address', 'i4'), ('value', 'i4')])
+
+
+@dataclass(frozen=True, slots=True)
+class PointValues:
+    """某一寄存器类型下全部点位的当前值"""
+    data: np.ndarray  # 结构化数组，字段 address / value
+    names: Tuple[str, ...]  # 点位名称，与 data 顺序一致
+    descriptions: Tuple[str, ...]  # 点位描述，与 data 顺序一致
+
+
+@dataclass(frozen=True, slots=True)
+class _PointGroup:
+    """按寄存器类型分组的点位元数据（配置加载时生成一次）"""
+    addresses: np.ndarray  # 点位地址
+    index: np.ndarray  # 数据块索引（越界者已截断到有效范围）
+    invalid: Optional[np.ndarray]  # 地址越界的点位掩码，全部有效时为 None
+    names: Tuple[str, ...]
+    descriptions: Tuple[str, ...]
+
+
+_slave_logger = logging.getLogger("pymodbus_gui.slave")
+
+
+class _SlaveLogAdapter(logging.LoggerAdapter):
+    """为日志加上 Slave 名称标签，仅在日志级别启用、实际输出时拼接"""
+    
+    def process(self, msg, kwargs):
+        kwargs["extra"] = self.extra
+        return f"[{self.extra['slave']}] {msg}", kwargs
+
+
+class _SharedLoop:
+    """所有 Slave 服务器共用的后台事件循环，首次使用时创建"""
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def get(self) -> asyncio.AbstractEventLoop:
+        """获取共享事件循环，循环线程不存在时启动"""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run, args=(loop,),
+                    name="modbus-slave-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+    
+    def call(self, coro, timeout: Optional[float] = _LOOP_CALL_TIMEOUT) -> Any:
+        """
+        在共享事件循环中执行协程并等待结果（不可在事件循环线程中调用）
+        
+        Args:
+            coro: 协程对象
+            timeout: 等待超时（秒），None 表示一直等待
+            
+        Raises:
+            TimeoutError: 超时未完成，协程随之取消
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.get())
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+    
+    def close(self) -> None:
+        """停止并关闭共享事件循环（应用退出时调用），之后再使用时重新创建"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=3.0)
+    
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop):
+        """在后台线程中运行事件循环，循环停止后在本线程内收尾并关闭"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            # 取消仍在运行的任务（服务器协程、延迟落盘等）并等待其结束，避免销毁挂起的任务
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+
+_shared_loop = _SharedLoop()
+
+
+def _point_int(value: Any) -> int:
+    """将点位初始值转换为整数，无法转换时返回 -1（初始化时按越界处理）"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _check_tcp_port(host: str, port: int) -> Optional[str]:
+    """
+    试绑定 TCP 监听地址
+    
+    不设置 SO_REUSEPORT：各 Slave 端口不同，共享端口无收益，且会让重复配置的端口静默绑定成功。
+    
+    Returns:
+        无法绑定时返回错误信息，否则返回 None
+    """
+    try:
+        family = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][0]
+        # create_server 在 POSIX 上设置 SO_REUSEADDR，刚停止的端口处于 TIME_WAIT 时仍可绑定
+        with socket.create_server((host, port), family=family):
+            pass
+    except OSError as e:
+        return str(e)
+    return None
+
+
+def _current_umask() -> int:
+    """读取进程 umask（os.umask 只能通过设置来读取，仅在模块加载时调用一次）"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+def _write_file_atomic(file_path: str, data: bytes, sync: bool = False) -> None:
+    """
+    先写入同目录临时文件再原子替换目标文件，写入失败时不会留下写了一半的文件
+    
+    每次写入使用独立的临时文件，并发保存同一文件时不会互相截断或抢先替换。
+    
+    Args:
+        file_path: 目标文件路径
+        data: 文件内容
+        sync: 是否在替换前将数据同步到磁盘
+    """
+    directory, name = os.path.split(file_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp 创建的文件权限为 0600：沿用目标文件原有权限，新文件按 umask 设置
+        try:
+            shutil.copymode(file_path, tmp_path)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _point_limits(points: List[RegisterPoint], size: int,
+                  is_bit: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    生成数据块每个索引允许写入的整数取值范围和只读标记
+    
+    无点位配置的地址只受存储类型范围限制；位类型只允许 0/1；
+    点位的浮点限值按整数取整（最小值向上、最大值向下），与 validate_value 对整数值的判断一致。
+    
+    Args:
+        points: 该寄存器类型的点位（同一地址以先出现者为准）
+        size: 数据块长度
+        is_bit: 是否为位类型
+        
+    Returns:
+        (最小值数组, 最大值数组, 只读掩码)
+    """
+    max_value = 1 if is_bit else 0xFFFF
+    lo = np.zeros(size, dtype=np.int32)
+    hi = np.full(size, max_value, dtype=np.int32)
+    read_only = np.zeros(size, dtype=bool)
+    if not points:
+        return lo, hi, read_only
+    
+    n = len(points)
+    index = np.fromiter((p.address for p in points), dtype=np.int64, count=n) + 1
+    keep = (index >= 0) & (index < size)
+    # 逆序赋值使同一地址先出现的点位生效
+    target = index[keep][::-1]
+    read_only[target] = np.fromiter((p.read_only for p in points), dtype=bool, count=n)[keep][::-1]
+    if not is_bit:
+        mins = np.fromiter((-np.inf if p.min_value is None else p.min_value for p in points),
+                           dtype=np.float64, count=n)
+        maxs = np.fromiter((np.inf if p.max_value is None else p.max_value for p in points),
+                           dtype=np.float64, count=n)
+        lo[target] = np.clip(np.ceil(mins), 0, max_value)[keep][::-1]
+        hi[target] = np.clip(np.floor(maxs), -1, max_value)[keep][::-1]
+    return lo, hi, read_only
+
+
+@lru_cache(maxsize=8)
+def _length_struct(count: int) -> struct.Struct:
+    """长度寄存器的打包格式（count 个大端无符号 16 位）"""
+    return struct.Struct(f'>{count}H')
+
+
+def _make_reader(view: memoryview) -> Callable[[int], int]:
+    """生成按协议地址读取数据块存储的函数，越界返回 0"""
+    size = len(view)
+    
+    def read(address: int) -> int:
+        # 与 SlaveContext 一致，协议地址 +1 为数据块索引
+        index = address + 1
+        return view[index] if 0 <= index < size else 0
+    
+    return read
+
+
+def _make_writer(view: memoryview) -> Callable[[int, int], bool]:
+    """生成按协议地址写入数据块存储的函数，越界时不写入并返回 False"""
+    size = len(view)
+    
+    def write(address: int, value: int) -> bool:
+        index = address + 1
+        if not 0 <= index < size:
+            return False
+        view[index] = value
+        return True
+    
+    return write
+
+
+class _ArrayDataBlock(ModbusSequentialDataBlock):
+    """
+    以 numpy 数组为存储的顺序数据块
+    
+    与 ModbusSequentialDataBlock 行为一致，getValues 在返回 pymodbus 前转换为列表。
+    """
+    
+    def __init__(self, address: int, values: np.ndarray):
+        """
+        Args:
+            address: 起始地址
+            values: 存储数组
+        """
+        self.address = address
+        self.values = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=np.uint16)
+        self.default_value = 0
+    
+    def default(self, count: int, value: Any = False) -> None:
+        # 基类实现会用 [value] * count 列表替换存储
+        self.default_value = int(value)
+        self.values = np.full(count, self.default_value, dtype=self.values.dtype)
+        self.address = 0
+    
+    def reset(self) -> None:
+        # 原地清零，不重新分配存储
+        self.values.fill(self.default_value)
+    
+    def getValues(self, address: int, count: int = 1) -> List[int]:
+        start = address - self.address
+        return self.values[start:start + count].tolist()
+    
+    def setValues(self, address: int, values: Any) -> None:
+        if not isinstance(values, list):
+            values = [values]
+        start = address - self.address
+        self.values[start:start + len(values)] = values
+
+
 class ModbusSlave:
     """单个 Modbus Slave 服务器"""
     
@@ -129,14 +485,17 @@ class ModbusSlave:
             config: Slave 配置
         """
         self.config = config
-        self.server_thread: Optional[threading.Thread] = None
+        self.logger = _SlaveLogAdapter(_slave_logger, {"slave": config.name})
+        self._log_prefix = f"[{config.name}] "  # 日志窗口消息前缀
         self.running = False
-        self.lock = threading.Lock()
         self.error_message: Optional[str] = None
         
-        # asyncio 相关
+        # asyncio 相关（所有 Slave 共用一个事件循环）
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.server: Optional[Any] = None  # 保存服务器实例
+        self._server_task: Optional[asyncio.Task] = None  # 运行服务器的任务（仅在事件循环线程中访问）
+        self._stop_event: Optional[asyncio.Event] = None  # 设置后服务器任务关闭服务器并结束
+        self._alock = asyncio.Lock()  # 启停互斥，在共享事件循环中使用
         
         # 数据存储
         self.datastore_context: Optional[ModbusServerContext] = None
@@ -145,9 +504,25 @@ class ModbusSlave:
         # 回调函数
         self.on_value_change: Optional[Callable] = None
         self.on_log: Optional[Callable[[str, str], None]] = None  # 日志回调 (message, level)
+        self.log_level = logging.INFO  # 低于此级别的日志不发送到日志回调（高负载时可设为 WARNING）
+        
+        # 设备标识（配置确定后不再变化，重启时复用）
+        self._identity = ModbusDeviceIdentification()
+        self._identity.VendorName = _VENDOR_NAME
+        self._identity.ProductCode = _PRODUCT_CODE
+        self._identity.VendorUrl = _VENDOR_URL
+        self._identity.ProductName = config.name
+        self._identity.ModelName = config.name
+        self._identity.MajorMinorRevision = _REVISION
         
         # 文件记录存储
-        self.file_data: Dict[int, bytes] = {}  # {file_number: file_content}
+        self.file_data: Dict[int, bytearray] = {}  # {file_number: file_content}，写入时原地修改
+        self._file_lock = threading.Lock()  # 保护文件数据修改与落盘快照
+        self._save_lock = threading.Lock()  # 串行化落盘，保证按快照先后顺序写入
+        self._file_dirty: Set[int] = set()  # 待写入磁盘的文件号
+        self._flush_future: Optional[Any] = None  # 已调度的延迟落盘任务
+        self._file_version: Dict[int, int] = {}  # 文件号 -> 数据版本，每次写入递增
+        self._read_cache: OrderedDict = OrderedDict()  # (文件号, 起始, 结束, 版本) -> 数据，LRU
         self._init_file_records()
         
         # 初始化数据存储
@@ -160,61 +535,122 @@ class ModbusSlave:
         
         for file_config in self.config.file_records:
             try:
-                file_path = Path(file_config.file_path)
-                if file_path.exists():
-                    with open(file_path, 'rb') as f:
-                        data = f.read(file_config.max_size)
-                        self.file_data[file_config.file_number] = data
-                        self._log(f"加载文件记录 {file_config.file_number}: {file_path.name} ({len(data)} 字节)", "INFO")
-                else:
-                    # 创建空文件
-                    self.file_data[file_config.file_number] = b''
-                    self._log(f"创建空文件记录 {file_config.file_number}", "INFO")
+                with open(file_config.file_path, 'rb') as f:
+                    # 按文件大小预分配缓冲区，一次读入
+                    data = bytearray(min(os.fstat(f.fileno()).st_size, file_config.max_size))
+                    del data[f.readinto(data):]
+                self.file_data[file_config.file_number] = data
+                self._log("加载文件记录 %s: %s (%s 字节)", "INFO",
+                          file_config.file_number, os.path.basename(file_config.file_path), len(data))
+            except FileNotFoundError:
+                # 创建空文件
+                self.file_data[file_config.file_number] = bytearray()
+                self._log("创建空文件记录 %s", "INFO", file_config.file_number)
             except Exception as e:
                 self._log(f"初始化文件记录 {file_config.file_number} 失败: {e}", "WARNING")
     
     def _init_datastore(self):
         """初始化数据存储"""
-        # 创建数据块
-        coils = ModbusSequentialDataBlock(0, [0] * self.config.coil_count)
-        discrete_inputs = ModbusSequentialDataBlock(0, [0] * self.config.discrete_input_count)
-        holding_registers = ModbusSequentialDataBlock(0, [0] * self.config.holding_register_count)
-        input_registers = ModbusSequentialDataBlock(0, [0] * self.config.input_register_count)
+        # 预分配存储数组（位 1 字节，寄存器 2 字节），初始值写入数组后再构造数据块
+        arrays: Dict[str, np.ndarray] = {
+            'coil': np.zeros(self.config.coil_count, dtype=np.uint8),
+            'discrete_input': np.zeros(self.config.discrete_input_count, dtype=np.uint8),
+            'holding_register': np.zeros(self.config.holding_register_count, dtype=np.uint16),
+            'input_register': np.zeros(self.config.input_register_count, dtype=np.uint16)
+        }
         
         self._log(f"初始化数据存储 - Coils:{self.config.coil_count}, DI:{self.config.discrete_input_count}, HR:{self.config.holding_register_count}, IR:{self.config.input_register_count}", "INFO")
         
-        # 创建从站上下文
-        self.slave_context = ModbusSlaveContext(
-            di=discrete_inputs,  # 离散输入
-            co=coils,  # 线圈
-            hr=holding_registers,  # 保持寄存器
-            ir=input_registers  # 输入寄存器
-        )
-        
-        # 根据点位配置初始化值
+        # 根据点位配置初始化值：按寄存器类型分组，每组一次性写入数组
         # 注意：SlaveContext的getValues/setValues使用Modbus协议地址，
-        # 但内部会+1转换为DataBlock索引
-        initialized_count = 0
+        # 但内部会+1转换为DataBlock索引，这里直接写数组需同样+1
+        # （点位的寄存器类型已在构造时校验）
+        grouped: Dict[str, List[RegisterPoint]] = {key: [] for key in arrays}
         for point in self.config.register_points:
-            try:
-                value = int(point.value)
-                # 通过SlaveContext设置值，直接使用Modbus协议地址
-                if point.register_type == 'coil':
-                    self.slave_context.setValues(1, point.address, [value])
-                elif point.register_type == 'discrete_input':
-                    self.slave_context.setValues(2, point.address, [value])
-                elif point.register_type == 'holding_register':
-                    self.slave_context.setValues(3, point.address, [value])
-                elif point.register_type == 'input_register':
-                    self.slave_context.setValues(4, point.address, [value])
-                logging.info(f"初始化点位 {point.name} (地址{point.address}) = {value}")
-                initialized_count += 1
-            except Exception as e:
-                logging.warning(f"初始化点位 {point.name} 失败: {e}")
-                self._log(f"初始化点位 {point.name} 失败: {e}", "WARNING")
+            grouped[point.register_type].append(point)
+        
+        initialized_count = 0
+        failed_names: List[str] = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for register_type, points in grouped.items():
+            if not points:
+                continue
+            array = arrays[register_type]
+            max_value = 1 if register_type in _BIT_TYPES else 0xFFFF
+            n = len(points)
+            index = np.fromiter((p.address for p in points), dtype=np.int64, count=n) + 1
+            values = np.fromiter((_point_int(p.value) for p in points), dtype=np.int64, count=n)
+            ok = (index >= 0) & (index < len(array)) & (values >= 0) & (values <= max_value)
+            # 同一地址重复配置时，逆序写入使先出现的点位生效（与点位索引一致）
+            array[index[ok][::-1]] = values[ok][::-1]
+            
+            # 逐点日志只在调试级别输出，其余情况只汇总计数
+            ok_count = int(ok.sum())
+            initialized_count += ok_count
+            if ok_count < n:
+                failed_names.extend(p.name for p, point_ok in zip(points, ok.tolist()) if not point_ok)
+            if debug:
+                for point, point_ok, value in zip(points, ok.tolist(), values.tolist()):
+                    if point_ok:
+                        self.logger.debug("初始化点位 %s (地址%d) = %d", point.name, point.address, value)
         
         if initialized_count > 0:
             self._log(f"成功初始化 {initialized_count} 个寄存器点位", "SUCCESS")
+        if failed_names:
+            shown = "、".join(failed_names[:10]) + (" 等" if len(failed_names) > 10 else "")
+            error_msg = f"{len(failed_names)} 个点位初始化失败（地址或值超出范围）: {shown}"
+            self.logger.warning(error_msg)
+            self._log(error_msg, "WARNING")
+        self.logger.info(
+            "初始化 %d/%d 点位 (失败: %d)",
+            initialized_count, len(self.config.register_points), len(failed_names)
+        )
+        
+        # 创建从站上下文
+        self.slave_context = ModbusSlaveContext(
+            di=_ArrayDataBlock(0, arrays['discrete_input']),  # 离散输入
+            co=_ArrayDataBlock(0, arrays['coil']),  # 线圈
+            hr=_ArrayDataBlock(0, arrays['holding_register']),  # 保持寄存器
+            ir=_ArrayDataBlock(0, arrays['input_register'])  # 输入寄存器
+        )
+        
+        # 按寄存器类型绑定功能码的读取函数，读取路径只需一次字典查找
+        self._getters: Dict[str, Callable] = {
+            register_type: partial(self.slave_context.getValues, fc) for register_type, fc in _RT_CODE.items()
+        }
+        
+        # 数据块存储，按寄存器类型生成直接读写存储的闭包，供 read_register/write_register 使用
+        # （数据块的 reset 为原地清零，闭包持有的视图始终有效）
+        self._arrays = arrays
+        self._readers: Dict[str, Callable[[int], int]] = {}
+        self._writers: Dict[str, Callable[[int, int], bool]] = {}
+        for register_type, array in self._arrays.items():
+            view = memoryview(array)
+            self._readers[register_type] = _make_reader(view)
+            self._writers[register_type] = _make_writer(view)
+        
+        self._rebuild_point_index()
+        
+        # write_registers 使用的逐地址限值 (最小值, 最大值, 只读)，按数据块索引排列
+        self._limits: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+            register_type: _point_limits(grouped[register_type], len(array), register_type in _BIT_TYPES)
+            for register_type, array in arrays.items()
+        }
+        
+        # get_all_values 使用的分组元数据，每次取值只需一次数组索引
+        self._point_groups: Dict[str, _PointGroup] = {}
+        for register_type, array in self._arrays.items():
+            points = grouped[register_type]
+            addresses = np.fromiter((p.address for p in points), dtype=np.int32, count=len(points))
+            index = addresses + 1  # 协议地址 +1 为数据块索引
+            invalid = (index < 0) | (index >= len(array))
+            self._point_groups[register_type] = _PointGroup(
+                addresses=addresses,
+                index=np.clip(index, 0, max(len(array) - 1, 0)),
+                invalid=invalid if invalid.any() else None,
+                names=tuple(p.name for p in points),
+                descriptions=tuple(p.description for p in points),
+            )
         
         # 创建服务器上下文（支持单个从站地址）
         self.datastore_context = ModbusServerContext(
@@ -229,44 +665,49 @@ class ModbusSlave:
         Returns:
             操作结果
         """
-        with self.lock:
+        try:
+            return _shared_loop.call(self.start_async())
+        except TimeoutError:
+            return OperationResult(False, error="启动超时")
+    
+    async def start_async(self) -> OperationResult:
+        """
+        在共享事件循环中启动 Slave 服务器
+        
+        Returns:
+            操作结果
+        """
+        async with self._alock:
             if self.running:
                 return OperationResult(False, error="服务器已在运行")
             
             try:
-                # 创建设备标识
-                identity = ModbusDeviceIdentification()
-                identity.VendorName = 'Pymodbus GUI'
-                identity.ProductCode = 'PM'
-                identity.VendorUrl = 'https://github.com/pymodbus-dev/pymodbus/'
-                identity.ProductName = self.config.name
-                identity.ModelName = self.config.name
-                identity.MajorMinorRevision = '2.0.0'
+                identity = self._identity
                 
-                # 根据连接类型启动服务器
+                # 根据连接类型选择服务器协程
                 if self.config.connection_type == SlaveConnectionType.RTU:
                     if not self.config.port:
                         return OperationResult(False, error="RTU 模式需要指定串口端口")
-                    
-                    # 在单独的线程中启动 RTU 服务器
-                    self.server_thread = threading.Thread(
-                        target=self._run_rtu_server,
-                        args=(identity,),
-                        daemon=True
-                    )
-                    self.server_thread.start()
-                
+                    server_coro = self._start_rtu_server(identity)
                 elif self.config.connection_type == SlaveConnectionType.TCP:
-                    # 在单独的线程中启动 TCP 服务器
-                    self.server_thread = threading.Thread(
-                        target=self._run_tcp_server,
-                        args=(identity,),
-                        daemon=True
+                    # 先试绑定端口，端口被占用时直接返回错误，不启动注定失败的服务器任务；
+                    # 地址解析和绑定是阻塞调用，放到线程中执行，不阻塞共享循环上的其他 Slave
+                    bind_error = await asyncio.to_thread(
+                        _check_tcp_port, self.config.host, self.config.tcp_port
                     )
-                    self.server_thread.start()
+                    if bind_error:
+                        return OperationResult(False, error=f"端口 {self.config.tcp_port} 不可用: {bind_error}")
+                    server_coro = self._start_tcp_server(identity)
+                else:
+                    return OperationResult(False, error=f"不支持的连接类型: {self.config.connection_type}")
                 
+                # 服务器作为共享事件循环中的任务运行，设置停止事件即可使其关闭
+                self._stop_event = asyncio.Event()
                 self.running = True
                 self.error_message = None
+                self.loop = asyncio.get_running_loop()
+                self._server_task = self.loop.create_task(server_coro)
+                self._server_task.add_done_callback(self._on_server_done)
                 success_msg = f"Slave {self.config.name} 启动成功"
                 self._log(success_msg, "SUCCESS")
                 return OperationResult(True, data=success_msg)
@@ -278,44 +719,19 @@ class ModbusSlave:
                 self._log(error_msg, "ERROR")
                 return OperationResult(False, error=error_msg)
     
-    def _run_rtu_server(self, identity):
-        """在线程中运行 RTU 服务器"""
-        try:
-            # 创建新的事件循环
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            
-            # 创建并调度服务器启动任务
-            self.loop.create_task(self._start_rtu_server(identity))
-            
-            # 运行事件循环直到被停止
-            self.loop.run_forever()
-            logging.info("RTU 服务器事件循环已退出")
-            
-        except Exception as e:
-            self.error_message = f"RTU 服务器异常: {str(e)}"
-            logging.error(self.error_message)
-        finally:
+    def _on_server_done(self, task: asyncio.Task):
+        """服务器任务结束（正常停止、取消或异常）时回调"""
+        if self._server_task is task:
+            self._server_task = None
             self.running = False
-            # 清理任务并关闭循环
-            try:
-                if self.loop and not self.loop.is_closed():
-                    # 取消所有待处理任务
-                    pending = asyncio.all_tasks(self.loop)
-                    for task in pending:
-                        task.cancel()
-                    # 等待任务取消完成
-                    if pending:
-                        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    self.loop.close()
-                    logging.info("RTU 服务器事件循环已关闭")
-            except Exception as e:
-                logging.error(f"清理RTU任务失败: {e}")
+        if not task.cancelled() and task.exception() is not None:
+            self.error_message = f"服务器异常: {task.exception()}"
+            self.logger.error(self.error_message)
     
     async def _start_rtu_server(self, identity):
         """启动 RTU 服务器的异步方法"""
         try:
-            self.server = await StartAsyncSerialServer(
+            self.server = ModbusSerialServer(
                 context=self.datastore_context,
                 identity=identity,
                 port=self.config.port,
@@ -325,77 +741,56 @@ class ModbusSlave:
                 stopbits=self.config.stopbits
             )
             info_msg = f"RTU 服务器已启动: {self.config.port} (波特率:{self.config.baudrate}, 从站地址:{self.config.device_address})"
-            logging.info(info_msg)
+            self.logger.info(info_msg)
             self._log(info_msg, "INFO")
-            # 服务器运行直到被关闭
-            await self.server.serve_forever()
-        except asyncio.CancelledError:
-            logging.info("RTU 服务器正常停止")
+            await self._serve()
+            self.logger.info("RTU 服务器正常停止")
             self._log("RTU 服务器正常停止", "INFO")
-            # 不重新抛出，让线程正常退出
         except Exception as e:
             error_msg = f"RTU 服务器错误: {e}"
-            logging.error(error_msg)
+            self.logger.error(error_msg)
             self._log(error_msg, "ERROR")
             raise
     
-    def _run_tcp_server(self, identity):
-        """在线程中运行 TCP 服务器"""
-        try:
-            # 创建新的事件循环
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            
-            # 创建并调度服务器启动任务
-            self.loop.create_task(self._start_tcp_server(identity))
-            
-            # 运行事件循环直到被停止
-            self.loop.run_forever()
-            logging.info("TCP 服务器事件循环已退出")
-            
-        except Exception as e:
-            self.error_message = f"TCP 服务器异常: {str(e)}"
-            logging.error(self.error_message)
-        finally:
-            self.running = False
-            # 清理任务并关闭循环
-            try:
-                if self.loop and not self.loop.is_closed():
-                    # 取消所有待处理任务
-                    pending = asyncio.all_tasks(self.loop)
-                    for task in pending:
-                        task.cancel()
-                    # 等待任务取消完成
-                    if pending:
-                        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    self.loop.close()
-                    logging.info("TCP 服务器事件循环已关闭")
-            except Exception as e:
-                logging.error(f"清理TCP任务失败: {e}")
-    
     async def _start_tcp_server(self, identity):
         """启动 TCP 服务器的异步方法"""
         try:
-            self.server = await StartAsyncTcpServer(
+            self.server = ModbusTcpServer(
                 context=self.datastore_context,
                 identity=identity,
                 address=(self.config.host, self.config.tcp_port)
             )
             info_msg = f"TCP 服务器已启动: {self.config.host}:{self.config.tcp_port} (从站地址:{self.config.device_address})"
-            logging.info(info_msg)
+            self.logger.info(info_msg)
             self._log(info_msg, "INFO")
-            # 服务器运行直到被关闭
-            await self.server.serve_forever()
-        except asyncio.CancelledError:
-            logging.info("TCP 服务器正常停止")
+            await self._serve()
+            self.logger.info("TCP 服务器正常停止")
             self._log("TCP 服务器正常停止", "INFO")
-            # 不重新抛出，让线程正常退出
         except Exception as e:
             error_msg = f"TCP 服务器错误: {e}"
-            logging.error(error_msg)
+            self.logger.error(error_msg)
             self._log(error_msg, "ERROR")
             raise
     
+    async def _serve(self):
+        """
+        运行服务器直到停止事件被设置或服务器自身退出
+        
+        两种情况下都会关闭服务器（共享事件循环不会随之关闭，需主动释放端口/串口），
+        服务器自身异常退出时重新抛出。
+        """
+        serve_task = asyncio.ensure_future(self.server.serve_forever())
+        stop_task = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            await asyncio.wait({serve_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_task.cancel()
+            await self._shutdown_server()
+            serve_task.cancel()  # 已结束时无效果
+            await asyncio.wait({serve_task})
+        if not serve_task.cancelled():
+            serve_task.result()
+    
     def stop(self) -> OperationResult:
         """
         停止 Slave 服务器
@@ -403,39 +798,38 @@ class ModbusSlave:
         Returns:
             操作结果
         """
-        with self.lock:
+        try:
+            return _shared_loop.call(self.stop_async())
+        except TimeoutError:
+            return OperationResult(False, error="停止超时")
+    
+    async def stop_async(self) -> OperationResult:
+        """
+        在共享事件循环中停止 Slave 服务器
+        
+        等待服务器关闭期间只挂起当前协程，不阻塞事件循环，多个 Slave 可并发停止。
+        
+        Returns:
+            操作结果
+        """
+        async with self._alock:
             if not self.running:
                 return OperationResult(True, data="服务器未运行")
             
             try:
-                logging.info("开始停止服务器...")
+                self.logger.info("开始停止服务器...")
                 self.running = False
                 
-                # 关闭服务器并停止事件循环
-                if self.loop and not self.loop.is_closed():
-                    try:
-                        # 先调用shutdown关闭服务器
-                        if self.server:
-                            future = asyncio.run_coroutine_threadsafe(self._shutdown_server(), self.loop)
-                            try:
-                                future.result(timeout=2.0)
-                                logging.info("服务器shutdown完成")
-                            except Exception as e:
-                                logging.warning(f"shutdown超时: {e}")
-                        
-                        # 停止事件循环
-                        self.loop.call_soon_threadsafe(self.loop.stop)
-                        logging.info("已调度事件循环停止")
-                    except Exception as e:
-                        logging.error(f"停止事件循环失败: {e}")
-                
-                # 等待线程结束
-                if self.server_thread and self.server_thread.is_alive():
-                    self.server_thread.join(timeout=3.0)
-                    if self.server_thread.is_alive():
-                        logging.warning("服务器线程未能在3秒内停止，但已调度停止")
+                # 通知服务器任务自行关闭服务器并结束
+                task = self._server_task
+                if task and not task.done():
+                    self._stop_event.set()
+                    done, _ = await asyncio.wait({task}, timeout=3.0)
+                    if not done:
+                        task.cancel()
+                        self.logger.warning("服务器任务未能在3秒内停止，已取消")
                     else:
-                        logging.info("服务器线程已停止")
+                        self.logger.info("服务器任务已停止")
                 
                 self.error_message = None
                 success_msg = f"Slave {self.config.name} 已停止"
@@ -444,26 +838,29 @@ class ModbusSlave:
                 
             except Exception as e:
                 error_msg = f"停止服务器失败: {e}"
-                logging.error(error_msg)
+                self.logger.error(error_msg)
                 self._log(error_msg, "ERROR")
                 return OperationResult(False, error=f"停止失败: {str(e)}")
     
     async def _shutdown_server(self):
         """异步关闭服务器"""
         try:
-            if self.server:
-                await self.server.shutdown()
-                logging.info("服务器已关闭")
+            # 置空后再关闭，避免停止流程和取消流程重复关闭
+            server, self.server = self.server, None
+            if server:
+                await server.shutdown()
+                self.logger.info("服务器已关闭")
         except Exception as e:
-            logging.error(f"关闭服务器时出错: {e}")
+            self.logger.error("关闭服务器时出错: %s", e)
     
-    def read_register(self, register_type: str, address: int) -> OperationResult:
+    def read_register(self, register_type: str, address: int, safe: bool = False) -> OperationResult:
         """
         读取寄存器值
         
         Args:
             register_type: 寄存器类型 (coil, discrete_input, holding_register, input_register)
             address: 地址（Modbus协议地址）
+            safe: 为 True 时经 SlaveContext.getValues 读取，否则直接读数据块存储
             
         Returns:
             操作结果
@@ -472,20 +869,22 @@ class ModbusSlave:
             if not self.slave_context:
                 return OperationResult(False, error="数据存储未初始化")
             
-            # 直接使用 Modbus 协议地址
-            if register_type == 'coil':
-                values = self.slave_context.getValues(1, address, count=1)
-            elif register_type == 'discrete_input':
-                values = self.slave_context.getValues(2, address, count=1)
-            elif register_type == 'holding_register':
-                values = self.slave_context.getValues(3, address, count=1)
-            elif register_type == 'input_register':
-                values = self.slave_context.getValues(4, address, count=1)
+            if safe:
+                getter = self._getters.get(register_type)
+                if getter is None:
+                    return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
+                
+                # 直接使用 Modbus 协议地址
+                values = getter(address, count=1)
+                value = values[0] if values else 0
             else:
-                return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
-            
-            value = values[0] if values else 0
-            self._log(f"读取 {register_type} 地址 {address} = {value}", "INFO")
+                reader = self._readers.get(register_type)
+                if reader is None:
+                    return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
+                value = reader(address)
+            # 界面刷新会逐点读取，读取日志只在调试级别输出
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("读取 %s 地址 %d = %s", register_type, address, value)
             return OperationResult(True, data=value)
             
         except Exception as e:
@@ -509,6 +908,10 @@ class ModbusSlave:
             if not self.slave_context:
                 return OperationResult(False, error="数据存储未初始化")
             
+            writer = self._writers.get(register_type)
+            if writer is None:
+                return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
+            
             # 检查点位配置
             point = self._find_point(register_type, address)
             if point:
@@ -521,17 +924,15 @@ class ModbusSlave:
                     self._log(error_msg, "WARNING")
                     return OperationResult(False, error=error_msg)
             
-            # 直接使用 Modbus 协议地址
-            if register_type == 'coil':
-                self.slave_context.setValues(1, address, [int(value)])
-            elif register_type == 'discrete_input':
-                self.slave_context.setValues(2, address, [int(value)])
-            elif register_type == 'holding_register':
-                self.slave_context.setValues(3, address, [int(value)])
-            elif register_type == 'input_register':
-                self.slave_context.setValues(4, address, [int(value)])
-            else:
-                return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
+            # int 值（最常见）不再经 int() 转换；位类型只接受 0/1，避免写入非法的线圈状态
+            if type(value) is not int:
+                value = int(value)
+            if register_type in _BIT_TYPES and value not in _BIT_VALUES:
+                return OperationResult(False, error=f"值 {value} 无效，位类型只能为 0 或 1")
+            
+            # 直接写入数据块存储，不构造临时列表
+            if not writer(address, value):
+                return OperationResult(False, error=f"地址 {address} 超出范围")
             
             # 触发回调
             if self.on_value_change:
@@ -546,25 +947,100 @@ class ModbusSlave:
             self._log(error_msg, "ERROR")
             return OperationResult(False, error=error_msg)
     
+    def write_registers(self, register_type: str, address: int, values: List[Any]) -> OperationResult:
+        """
+        批量写入连续地址的寄存器值
+        
+        整段一次写入数据块，值变化回调和日志各触发一次。
+        
+        Args:
+            register_type: 寄存器类型 (coil, discrete_input, holding_register, input_register)
+            address: 起始地址（Modbus协议地址）
+            values: 值列表
+            
+        Returns:
+            操作结果
+        """
+        try:
+            if not self.slave_context:
+                return OperationResult(False, error="数据存储未初始化")
+            
+            array = self._arrays.get(register_type)
+            if array is None:
+                return OperationResult(False, error=f"无效的寄存器类型: {register_type}")
+            
+            values = [int(v) for v in values]
+            start = address + 1  # 协议地址 +1 为数据块索引
+            end = start + len(values)
+            if start < 0 or end > len(array):
+                return OperationResult(False, error=f"地址 {address}-{address + len(values) - 1} 超出范围")
+            
+            # 按预先生成的逐地址限值整段检查（含点位只读与取值范围、存储类型范围）
+            lo, hi, read_only = self._limits[register_type]
+            batch = np.asarray(values, dtype=np.int64)
+            blocked = read_only[start:end]
+            if blocked.any():
+                error_msg = f"地址 {address + int(blocked.argmax())} 为只读"
+                self._log(error_msg, "WARNING")
+                return OperationResult(False, error=error_msg)
+            bad = (batch < lo[start:end]) | (batch > hi[start:end])
+            if bad.any():
+                offset = int(bad.argmax())
+                error_msg = f"地址 {address + offset} 的值 {values[offset]} 超出有效范围"
+                self._log(error_msg, "WARNING")
+                return OperationResult(False, error=error_msg)
+            
+            array[start:end] = batch
+            
+            # 触发回调（values 为整段值列表）
+            if self.on_value_change:
+                self.on_value_change(register_type, address, values)
+            
+            success_msg = f"写入 {register_type} 地址 {address} 起 {len(values)} 个值"
+            self._log(success_msg, "SUCCESS")
+            return OperationResult(True, data=success_msg)
+            
+        except Exception as e:
+            error_msg = f"写入失败: {str(e)}"
+            self._log(error_msg, "ERROR")
+            return OperationResult(False, error=error_msg)
+    
+    def _rebuild_point_index(self):
+        """
+        重建点位索引和文件记录索引
+        
+        修改 config.register_points / config.file_records 后需调用。
+        同一地址（文件号）重复配置时以先出现者为准。
+        """
+        self._point_index: Dict[Tuple[str, int], RegisterPoint] = {}
+        for point in self.config.register_points:
+            self._point_index.setdefault((point.register_type, point.address), point)
+        
+        self._file_index: Dict[int, FileRecordConfig] = {}
+        for file_config in self.config.file_records:
+            self._file_index.setdefault(file_config.file_number, file_config)
+    
     def _find_point(self, register_type: str, address: int) -> Optional[RegisterPoint]:
         """查找点位配置"""
-        for point in self.config.register_points:
-            if point.register_type == register_type and point.address == address:
-                return point
-        return None
+        return self._point_index.get((register_type, address))
     
-    def _log(self, message: str, level: str = "INFO"):
+    def _log(self, message: str, level: str = "INFO", *args):
         """记录日志到日志窗口
         
         Args:
-            message: 日志消息
+            message: 日志消息，带 args 时为 % 格式串
             level: 日志级别 (INFO/WARNING/ERROR/SUCCESS)
+            args: 格式化参数，仅在日志会被输出时才格式化
         """
-        if self.on_log:
-            try:
-                self.on_log(f"[{self.config.name}] {message}", level)
-            except Exception as e:
-                logging.error(f"日志回调失败: {e}")
+        callback = self.on_log
+        if callback is None or _LOG_LEVELS.get(level, logging.INFO) < self.log_level:
+            return
+        try:
+            if args:
+                message = message % args
+            callback(self._log_prefix + message, level)
+        except Exception as e:
+            self.logger.error("日志回调失败: %s", e)
     
     def read_file_record(self, file_number: int, record_number: int = 0, record_length: Optional[int] = None) -> OperationResult:
         """
@@ -583,11 +1059,7 @@ class ModbusSlave:
                 return OperationResult(False, error="文件操作功能未启用")
             
             # 查找文件配置
-            file_config = None
-            for fc in self.config.file_records:
-                if fc.file_number == file_number:
-                    file_config = fc
-                    break
+            file_config = self._file_index.get(file_number)
             
             if not file_config:
                 return OperationResult(False, error=f"文件 {file_number} 配置不存在")
@@ -602,7 +1074,7 @@ class ModbusSlave:
                     trigger_value = file_number if file_config.trigger_function_code == 6 else 1
                     if file_config.trigger_function_code == 6:  # 写单个寄存器
                         self.slave_context.setValues(3, file_config.trigger_address, [trigger_value])
-                    self._log(f"触发文件 {file_number} 读取，地址={file_config.trigger_address}", "INFO")
+                    self._log("触发文件 %s 读取，地址=%s", "INFO", file_number, file_config.trigger_address)
                 except Exception as e:
                     self._log(f"触发寄存器写入失败: {e}", "WARNING")
             
@@ -611,7 +1083,7 @@ class ModbusSlave:
                 # 优先使用固定长度
                 if file_config.file_length is not None:
                     byte_length = file_config.file_length
-                    self._log(f"使用固定长度: {byte_length} 字节", "INFO")
+                    self._log("使用固定长度: %s 字节", "INFO", byte_length)
                 # 否则从长度寄存器读取
                 elif file_config.length_register_enabled:
                     try:
@@ -622,17 +1094,11 @@ class ModbusSlave:
                                 file_config.length_address, 
                                 count=file_config.length_quantity
                             )
-                            # 根据寄存器数量解析长度
-                            if file_config.length_quantity == 1:
-                                byte_length = length_values[0]
-                            elif file_config.length_quantity == 2:
-                                # 假设高位在前（Big Endian）
-                                byte_length = (length_values[0] << 16) | length_values[1]
-                            else:
-                                byte_length = sum(v << (16 * (file_config.length_quantity - 1 - i)) 
-                                                for i, v in enumerate(length_values))
+                            # 按寄存器数量解析长度，高位寄存器在前（Big Endian）
+                            packed = _length_struct(len(length_values)).pack(*length_values)
+                            byte_length = int.from_bytes(packed, 'big')
                             
-                            self._log(f"从寄存器读取长度: {byte_length} 字节 (地址={file_config.length_address})", "INFO")
+                            self._log("从寄存器读取长度: %s 字节 (地址=%s)", "INFO", byte_length, file_config.length_address)
                         else:
                             return OperationResult(False, error=f"不支持的长度功能码: {file_config.length_function_code}")
                     except Exception as e:
@@ -640,18 +1106,28 @@ class ModbusSlave:
                 else:
                     # 读取整个文件
                     byte_length = len(self.file_data[file_number]) - record_number * 2
-                    self._log(f"读取剩余全部数据: {byte_length} 字节", "INFO")
+                    self._log("读取剩余全部数据: %s 字节", "INFO", byte_length)
             else:
                 # 使用指定的record_length（字数转字节数）
                 byte_length = record_length * 2
             
-            # 3. 读取文件数据
-            file_content = self.file_data[file_number]
-            start = record_number * 2
-            end = min(start + byte_length, len(file_content))
-            data = file_content[start:end]
+            # 3. 读取文件数据（主站轮询通常重复读取同一区间，按文件版本缓存）
+            with self._file_lock:
+                file_content = self.file_data[file_number]
+                start = record_number * 2
+                end = min(start + byte_length, len(file_content))
+                key = (file_number, start, end, self._file_version.get(file_number, 0))
+                data = self._read_cache.get(key)
+                if data is None:
+                    # 返回独立的 bytes，后续写入不影响已读出的数据
+                    data = bytes(memoryview(file_content)[start:end])
+                    self._read_cache[key] = data
+                    if len(self._read_cache) > _READ_CACHE_SIZE:
+                        self._read_cache.popitem(last=False)
+                else:
+                    self._read_cache.move_to_end(key)
             
-            self._log(f"读取文件记录 {file_number}, 偏移={record_number}, 长度={len(data)}字节", "SUCCESS")
+            self._log("读取文件记录 %s, 偏移=%s, 长度=%s字节", "SUCCESS", file_number, record_number, len(data))
             return OperationResult(True, data=data)
             
         except Exception as e:
@@ -676,11 +1152,7 @@ class ModbusSlave:
                 return OperationResult(False, error="文件操作功能未启用")
             
             # 查找文件配置
-            file_config = None
-            for fc in self.config.file_records:
-                if fc.file_number == file_number:
-                    file_config = fc
-                    break
+            file_config = self._file_index.get(file_number)
             
             if not file_config:
                 return OperationResult(False, error=f"文件 {file_number} 未配置")
@@ -688,10 +1160,6 @@ class ModbusSlave:
             if file_config.read_only:
                 return OperationResult(False, error=f"文件 {file_number} 为只读")
             
-            # 初始化文件数据（如果不存在）
-            if file_number not in self.file_data:
-                self.file_data[file_number] = b''
-            
             # 扩展文件大小（如果需要）
             offset = record_number * 2
             required_size = offset + len(data)
@@ -699,25 +1167,27 @@ class ModbusSlave:
             if required_size > file_config.max_size:
                 return OperationResult(False, error=f"超出文件最大大小 {file_config.max_size}")
             
-            current_data = bytearray(self.file_data[file_number])
-            
-            # 扩展到需要的大小
-            if len(current_data) < required_size:
-                current_data.extend(b'\x00' * (required_size - len(current_data)))
-            
-            # 写入数据
-            current_data[offset:offset+len(data)] = data
-            self.file_data[file_number] = bytes(current_data)
-            
-            # 保存到文件
-            if file_config.file_path:
-                try:
-                    with open(file_config.file_path, 'wb') as f:
-                        f.write(self.file_data[file_number])
-                except Exception as e:
-                    self._log(f"保存文件失败: {e}", "WARNING")
+            with self._file_lock:
+                # 文件数据不存在时初始化，之后原地扩展和写入
+                current_data = self.file_data.setdefault(file_number, bytearray())
+                
+                # 扩展到需要的大小
+                if len(current_data) < required_size:
+                    current_data.extend(bytes(required_size - len(current_data)))
+                
+                # 写入数据，旧版本的读取缓存随之失效
+                current_data[offset:offset+len(data)] = data
+                self._file_version[file_number] = self._file_version.get(file_number, 0) + 1
+                
+                # 标记待保存，连续写入合并为一次延迟落盘
+                if file_config.file_path:
+                    self._file_dirty.add(file_number)
+                    if self._flush_future is None or self._flush_future.done():
+                        self._flush_future = asyncio.run_coroutine_threadsafe(
+                            self._flush_files_later(), _shared_loop.get()
+                        )
             
-            self._log(f"写入文件记录 {file_number}, 偏移={record_number}, 长度={len(data)}字节", "SUCCESS")
+            self._log("写入文件记录 %s, 偏移=%s, 长度=%s字节", "SUCCESS", file_number, record_number, len(data))
             return OperationResult(True, data=f"成功写入 {len(data)} 字节")
             
         except Exception as e:
@@ -725,6 +1195,47 @@ class ModbusSlave:
             self._log(error_msg, "ERROR")
             return OperationResult(False, error=error_msg)
     
+    def _take_dirty_files(self) -> List[Tuple[str, bytes]]:
+        """取出待保存文件的路径和数据快照，并清空待保存标记"""
+        with self._file_lock:
+            dirty, self._file_dirty = self._file_dirty, set()
+            self._flush_future = None
+            return [
+                (self._file_index[file_number].file_path, bytes(self.file_data[file_number]))
+                for file_number in dirty
+            ]
+    
+    def _save_files(self, files: List[Tuple[str, bytes]], sync: bool = False):
+        """将文件快照写入磁盘，失败时记录警告"""
+        for file_path, data in files:
+            try:
+                _write_file_atomic(file_path, data, sync)
+            except Exception as e:
+                self._log(f"保存文件失败: {e}", "WARNING")
+    
+    def _save_dirty_files(self, sync: bool = False):
+        """
+        取快照并保存待保存的文件
+        
+        快照与写入都在落盘锁内完成，较早的快照不会在较新的快照之后落盘覆盖它。
+        
+        Args:
+            sync: 是否同步到磁盘
+        """
+        with self._save_lock:
+            files = self._take_dirty_files()
+            if files:
+                self._save_files(files, sync)
+    
+    async def _flush_files_later(self):
+        """等待一个落盘间隔后保存期间修改过的文件，磁盘写入在线程池中进行"""
+        await asyncio.sleep(_FILE_FLUSH_INTERVAL)
+        await asyncio.to_thread(self._save_dirty_files)
+    
+    def flush_files(self):
+        """立即保存所有待保存的文件记录并同步到磁盘（关闭时调用）"""
+        self._save_dirty_files(sync=True)
+    
     def get_file_info(self) -> List[Dict[str, Any]]:
         """
         获取所有文件信息
@@ -745,42 +1256,31 @@ class ModbusSlave:
             })
         return file_info
     
-    def get_all_values(self) -> Dict[str, Any]:
+    def get_all_values(self) -> Dict[str, PointValues]:
         """
-        获取所有寄存器的值
+        获取所有寄存器点位的值
         
         Returns:
-            寄存器值字典
+            {'coils'/'discrete_inputs'/'holding_registers'/'input_registers': PointValues}，
+            地址超出数据块范围的点位值为 0
         """
-        values = {
-            'coils': [],
-            'discrete_inputs': [],
-            'holding_registers': [],
-            'input_registers': []
-        }
-        
-        try:
-            if self.slave_context:
-                # 读取所有配置的点位
-                for point in self.config.register_points:
-                    result = self.read_register(point.register_type, point.address)
-                    if result.success:
-                        key_map = {
-                            'coil': 'coils',
-                            'discrete_input': 'discrete_inputs',
-                            'holding_register': 'holding_registers',
-                            'input_register': 'input_registers'
-                        }
-                        key = key_map.get(point.register_type)
-                        if key:
-                            values[key].append({
-                                'address': point.address,
-                                'name': point.name,
-                                'value': result.data,
-                                'description': point.description
-                            })
-        except Exception as e:
-            logging.error(f"获取所有值失败: {e}")
+        values: Dict[str, PointValues] = {}
+        for register_type, key in _VALUE_KEYS.items():
+            group = self._point_groups.get(register_type)
+            if group is None:
+                values[key] = PointValues(np.empty(0, dtype=_POINT_VALUE_DTYPE), (), ())
+                continue
+            
+            data = np.empty(len(group.addresses), dtype=_POINT_VALUE_DTYPE)
+            data['address'] = group.addresses
+            try:
+                data['value'] = self._arrays[register_type][group.index]
+                if group.invalid is not None:
+                    data['value'][group.invalid] = 0
+            except Exception as e:
+                data['value'] = 0
+                self.logger.error("获取所有值失败: %s", e)
+            values[key] = PointValues(data, group.names, group.descriptions)
         
         return values
 
@@ -790,7 +1290,9 @@ class SlaveManager:
     
     def __init__(self):
         """初始化 Slave 管理器"""
-        self.slaves: Dict[str, ModbusSlave] = {}
+        self._slaves: Dict[str, ModbusSlave] = {}  # 可变字典，只在持锁时修改
+        # 对外发布的只读快照，每次增删后整体替换，读取无需加锁
+        self.slaves: Mapping[str, ModbusSlave] = MappingProxyType({})
         self.lock = threading.Lock()
         self.on_log: Optional[Callable[[str, str], None]] = None  # 日志回调
     
@@ -804,16 +1306,21 @@ class SlaveManager:
         Returns:
             操作结果
         """
+        duplicate_error = OperationResult(False, error=f"Slave ID {config.slave_id} 已存在")
+        if config.slave_id in self.slaves:
+            return duplicate_error
+        
+        # 初始化数据存储较耗时，在锁外创建，锁内只做登记
+        slave = ModbusSlave(config)
+        # 设置日志回调
+        if self.on_log:
+            slave.on_log = self.on_log
+        
         with self.lock:
-            if config.slave_id in self.slaves:
-                return OperationResult(False, error=f"Slave ID {config.slave_id} 已存在")
-            
-            slave = ModbusSlave(config)
-            # 设置日志回调
-            if self.on_log:
-                slave.on_log = self.on_log
-            self.slaves[config.slave_id] = slave
-            return OperationResult(True, data=f"Slave {config.name} 添加成功")
+            if self._slaves.setdefault(config.slave_id, slave) is not slave:
+                return duplicate_error
+            self._publish()
+        return OperationResult(True, data=f"Slave {config.name} 添加成功")
     
     def remove_slave(self, slave_id: str) -> OperationResult:
         """
@@ -826,15 +1333,20 @@ class SlaveManager:
             操作结果
         """
         with self.lock:
-            if slave_id not in self.slaves:
+            slave = self._slaves.pop(slave_id, None)
+            if slave is None:
                 return OperationResult(False, error=f"Slave ID {slave_id} 不存在")
-            
-            slave = self.slaves[slave_id]
-            if slave.running:
-                slave.stop()
-            
-            del self.slaves[slave_id]
-            return OperationResult(True, data="Slave 移除成功")
+            self._publish()
+        
+        # 停止服务器（每个 Slave 自带启停锁）在管理器锁外进行，不阻塞其他 Slave 的增删
+        if slave.running:
+            slave.stop()
+        slave.flush_files()
+        return OperationResult(True, data="Slave 移除成功")
+    
+    def _publish(self) -> None:
+        """发布当前 Slave 字典的只读快照（需持锁调用）"""
+        self.slaves = MappingProxyType(dict(self._slaves))
     
     def get_slave(self, slave_id: str) -> Optional[ModbusSlave]:
         """
@@ -848,14 +1360,14 @@ class SlaveManager:
         """
         return self.slaves.get(slave_id)
     
-    def get_all_slaves(self) -> List[ModbusSlave]:
+    def get_all_slaves(self) -> Tuple[ModbusSlave, ...]:
         """
         获取所有 Slave
         
         Returns:
-            Slave 列表
+            Slave 元组（当前快照）
         """
-        return list(self.slaves.values())
+        return tuple(self.slaves.values())
     
     def start_slave(self, slave_id: str) -> OperationResult:
         """
@@ -889,8 +1401,79 @@ class SlaveManager:
         
         return slave.stop()
     
+    def write_registers(self, slave_id: str, register_type: str, address: int,
+                        values: List[Any]) -> OperationResult:
+        """
+        批量写入指定 Slave 的连续寄存器
+        
+        Args:
+            slave_id: Slave ID
+            register_type: 寄存器类型
+            address: 起始地址
+            values: 值列表
+            
+        Returns:
+            操作结果
+        """
+        slave = self.get_slave(slave_id)
+        if not slave:
+            return OperationResult(False, error=f"Slave ID {slave_id} 不存在")
+        
+        return slave.write_registers(register_type, address, values)
+    
+    def start_all(self) -> Dict[str, OperationResult]:
+        """
+        启动所有未运行的 Slave
+        
+        Returns:
+            {slave_id: 操作结果}，只包含本次尝试启动的 Slave
+        """
+        if all(slave.running for slave in self.slaves.values()):
+            return {}
+        try:
+            return _shared_loop.call(self.start_all_async())
+        except TimeoutError:
+            return {
+                slave_id: OperationResult(False, error="启动超时")
+                for slave_id, slave in self.slaves.items() if not slave.running
+            }
+    
+    async def start_all_async(self) -> Dict[str, OperationResult]:
+        """在共享事件循环中并发启动所有未运行的 Slave"""
+        pending = [(slave_id, slave) for slave_id, slave in self.slaves.items() if not slave.running]
+        results = await asyncio.gather(*(slave.start_async() for _, slave in pending))
+        return {slave_id: result for (slave_id, _), result in zip(pending, results)}
+    
     def stop_all(self) -> None:
-        """停止所有 Slave"""
-        for slave in self.slaves.values():
-            if slave.running:
-                slave.stop()
+        """停止所有 Slave 并保存尚未落盘的文件记录"""
+        # 对只读快照取一次列表，停止与保存针对同一批 Slave，无需持有管理器锁
+        slaves = tuple(self.slaves.values())
+        if not slaves:
+            return
+        try:
+            _shared_loop.call(self.stop_all_async(slaves))
+        except TimeoutError:
+            # 事件循环无响应时仍在当前线程保存文件记录
+            _slave_logger.warning("停止所有 Slave 超时")
+            for slave in slaves:
+                slave.flush_files()
+    
+    def shutdown(self) -> None:
+        """停止所有 Slave 并关闭共享事件循环（应用退出时调用）"""
+        self.stop_all()
+        _shared_loop.close()
+    
+    async def stop_all_async(self, slaves: Optional[Tuple[ModbusSlave, ...]] = None) -> None:
+        """
+        在共享事件循环中并发停止 Slave，随后并发保存各自的文件记录
+        
+        每个 Slave 的停止受其自身超时约束，总耗时取决于最慢的一个而非总和。
+        
+        Args:
+            slaves: 要停止的 Slave，默认为当前所有 Slave
+        """
+        if slaves is None:
+            slaves = tuple(self.slaves.values())
+        await asyncio.gather(*(slave.stop_async() for slave in slaves if slave.running))
+        # 文件同步（fsync）是阻塞 I/O，放到线程中并发执行
+        await asyncio.gather(*(asyncio.to_thread(slave.flush_files) for slave in slaves))
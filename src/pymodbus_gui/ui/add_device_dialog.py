@@ -1,16 +1,74 @@
 """
 添加/编辑设备对话框
 """
+import time
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox,
     QPushButton, QGroupBox, QMessageBox, QLabel
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QIntValidator
 
 from pymodbus_gui.core.device_manager import DeviceManager, DeviceConfig, ConnectionType
-import serial.tools.list_ports
+
+
+# 串口参数选项（模块级常量，各对话框实例共用）
+_BAUDRATES = ("9600", "19200", "38400", "57600", "115200")
+_BYTESIZES = ("7", "8")
+_STOPBITS = ("1", "2")
+PARITY_CODE_TO_LABEL = {'N': 'N (无)', 'E': 'E (偶)', 'O': 'O (奇)'}
+PARITY_LABEL_TO_CODE = {label: code for code, label in PARITY_CODE_TO_LABEL.items()}
+_PARITY_LABELS = tuple(PARITY_CODE_TO_LABEL.values())
+
+# 串口列表缓存：枚举串口较慢（Windows 下经 WMI），短时间内重复打开对话框时复用结果
+_PORT_TTL = 2.0  # 缓存有效期（秒）
+_PORT_CACHE = {"ts": 0.0, "ports": []}
+
+
+def _get_ports_cached(force: bool = False) -> list:
+    """
+    获取可用串口名称列表
+    
+    Args:
+        force: 为 True 时忽略缓存重新枚举
+    """
+    now = time.monotonic()
+    if force or now - _PORT_CACHE["ts"] > _PORT_TTL:
+        # 首次枚举时才导入 pyserial 的串口枚举模块（连同平台相关后端）
+        from serial.tools import list_ports
+        _PORT_CACHE["ports"] = [port.device for port in list_ports.comports()]
+        _PORT_CACHE["ts"] = now
+    return _PORT_CACHE["ports"]
+
+
+# 对话框关闭时仍在运行的连接测试 {(线程, 工作对象)}，保持 Python 引用直到线程结束
+_DETACHED_TESTS: set = set()
+
+
+class ConnectionTestWorker(QObject):
+    """连接测试工作对象，在工作线程中建立并断开临时连接"""
+    
+    finished = pyqtSignal(bool, str)  # (是否成功, 错误信息)
+    
+    def __init__(self, config: DeviceConfig):
+        """
+        Args:
+            config: 待测试的设备配置
+        """
+        super().__init__()
+        self.config = config
+    
+    def run(self):
+        """执行连接测试（临时设备只在工作线程中创建和访问）"""
+        from pymodbus_gui.core.device_manager import ModbusDevice
+        test_device = ModbusDevice(self.config)
+        
+        result = test_device.connect()
+        if result.success:
+            test_device.disconnect()
+        self.finished.emit(result.success, result.error or "")
 
 
 class AddDeviceDialog(QDialog):
@@ -32,6 +90,10 @@ class AddDeviceDialog(QDialog):
         self.edit_mode = edit_mode
         self.original_config = device_config
         
+        # 进行中的连接测试（线程结束后清空）
+        self._test_thread: QThread | None = None
+        self._test_worker: ConnectionTestWorker | None = None
+        
         self.setWindowTitle("编辑设备" if edit_mode else "添加设备")
         self.setModal(True)
         self.setMinimumWidth(500)
@@ -96,30 +158,30 @@ class AddDeviceDialog(QDialog):
         port_layout.addWidget(self.port_combo)
         
         refresh_btn = QPushButton("刷新")
-        refresh_btn.clicked.connect(self.refresh_ports)
+        refresh_btn.clicked.connect(lambda: self.refresh_ports(force=True))
         port_layout.addWidget(refresh_btn)
         rtu_layout.addRow("串口端口 *:", port_layout)
         
         # 波特率
         self.baudrate_combo = QComboBox()
         self.baudrate_combo.setEditable(True)
-        self.baudrate_combo.addItems(["9600", "19200", "38400", "57600", "115200"])
+        self.baudrate_combo.addItems(_BAUDRATES)
         rtu_layout.addRow("波特率:", self.baudrate_combo)
         
         # 数据位
         self.bytesize_combo = QComboBox()
-        self.bytesize_combo.addItems(["7", "8"])
+        self.bytesize_combo.addItems(_BYTESIZES)
         self.bytesize_combo.setCurrentText("8")
         rtu_layout.addRow("数据位:", self.bytesize_combo)
         
         # 校验位
         self.parity_combo = QComboBox()
-        self.parity_combo.addItems(["N (无)", "E (偶)", "O (奇)"])
+        self.parity_combo.addItems(_PARITY_LABELS)
         rtu_layout.addRow("校验位:", self.parity_combo)
         
         # 停止位
         self.stopbits_combo = QComboBox()
-        self.stopbits_combo.addItems(["1", "2"])
+        self.stopbits_combo.addItems(_STOPBITS)
         rtu_layout.addRow("停止位:", self.stopbits_combo)
         
         self.rtu_group.setLayout(rtu_layout)
@@ -147,9 +209,9 @@ class AddDeviceDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        test_btn = QPushButton("测试连接")
-        test_btn.clicked.connect(self.test_connection)
-        button_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("测试连接")
+        self.test_btn.clicked.connect(self.test_connection)
+        button_layout.addWidget(self.test_btn)
         
         cancel_btn = QPushButton("取消")
         cancel_btn.clicked.connect(self.reject)
@@ -165,14 +227,18 @@ class AddDeviceDialog(QDialog):
         # 初始状态
         self.on_connection_type_changed("RTU")
     
-    def refresh_ports(self):
-        """刷新串口列表"""
+    def refresh_ports(self, force: bool = False):
+        """
+        刷新串口列表
+        
+        Args:
+            force: 为 True 时跳过缓存重新枚举串口（"刷新"按钮）
+        """
         current_text = self.port_combo.currentText()
         self.port_combo.clear()
         
         # 获取可用串口
-        ports = serial.tools.list_ports.comports()
-        port_list = [port.device for port in ports]
+        port_list = _get_ports_cached(force)
         
         if port_list:
             self.port_combo.addItems(port_list)
@@ -204,8 +270,9 @@ class AddDeviceDialog(QDialog):
             self.baudrate_combo.setCurrentText(str(config.baudrate))
             self.bytesize_combo.setCurrentText(str(config.bytesize))
             
-            parity_map = {'N': 'N (无)', 'E': 'E (偶)', 'O': 'O (奇)'}
-            self.parity_combo.setCurrentText(parity_map.get(config.parity, 'N (无)'))
+            self.parity_combo.setCurrentText(
+                PARITY_CODE_TO_LABEL.get(config.parity, PARITY_CODE_TO_LABEL['N'])
+            )
             
             self.stopbits_combo.setCurrentText(str(config.stopbits))
         else:  # TCP
@@ -230,8 +297,7 @@ class AddDeviceDialog(QDialog):
             config.baudrate = int(self.baudrate_combo.currentText())
             config.bytesize = int(self.bytesize_combo.currentText())
             
-            parity_text = self.parity_combo.currentText()
-            config.parity = parity_text[0]  # 取第一个字符 N/E/O
+            config.parity = PARITY_LABEL_TO_CODE.get(self.parity_combo.currentText(), 'N')
             
             config.stopbits = int(self.stopbits_combo.currentText())
         else:  # TCP
@@ -271,17 +337,53 @@ class AddDeviceDialog(QDialog):
             QMessageBox.warning(self, "验证失败", error)
             return
         
-        # 创建临时设备进行测试
-        from pymodbus_gui.core.device_manager import ModbusDevice
-        test_device = ModbusDevice(config)
-        
-        result = test_device.connect()
+        # 在工作线程中测试，连接超时期间界面保持响应
+        self.test_btn.setEnabled(False)
+        self.test_btn.setText("测试中...")
+        
+        thread = QThread()
+        worker = ConnectionTestWorker(config)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self.on_test_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(self._on_test_thread_finished)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        
+        self._test_thread, self._test_worker = thread, worker
+        thread.start()
+    
+    def on_test_finished(self, success: bool, error: str):
+        """连接测试完成"""
+        self.test_btn.setEnabled(True)
+        self.test_btn.setText("测试连接")
         
-        if result.success:
-            test_device.disconnect()
+        if success:
             QMessageBox.information(self, "测试成功", "设备连接测试成功！")
         else:
-            QMessageBox.critical(self, "测试失败", f"连接测试失败:\n{result.error}")
+            QMessageBox.critical(self, "测试失败", f"连接测试失败:\n{error}")
+    
+    def _on_test_thread_finished(self):
+        """测试线程结束，释放引用"""
+        self._test_thread = None
+        self._test_worker = None
+    
+    def done(self, result: int):
+        """关闭对话框；进行中的连接测试与对话框脱钩，在后台结束后自行清理，不阻塞界面"""
+        if self._test_thread is not None:
+            thread, worker = self._test_thread, self._test_worker
+            self._test_thread = self._test_worker = None
+            worker.finished.disconnect(self.on_test_finished)
+            thread.finished.disconnect(self._on_test_thread_finished)
+            
+            # 线程结束后 worker.finished -> quit -> deleteLater 照常执行，这里只保留引用到那时
+            entry = (thread, worker)
+            _DETACHED_TESTS.add(entry)
+            thread.finished.connect(lambda: _DETACHED_TESTS.discard(entry))
+            if thread.isFinished():
+                _DETACHED_TESTS.discard(entry)
+        super().done(result)
     
     def accept_config(self):
         """确认配置"""
@@ -294,9 +396,8 @@ class AddDeviceDialog(QDialog):
         
         # 添加或更新设备
         if self.edit_mode:
-            # 编辑模式：删除旧设备，添加新配置
-            self.device_manager.remove_device(self.original_config.device_id)
-            result = self.device_manager.add_device(config)
+            # 编辑模式：原地更新配置，连接参数未变时保留连接
+            result = self.device_manager.update_device(config)
         else:
             # 添加模式
             result = self.device_manager.add_device(config)
@@ -14,6 +14,15 @@ from pymodbus_gui.core.slave_server import SlaveConfig, SlaveConnectionType, Reg
 from pymodbus_gui.core.register_manager import RegisterManager
 
 
+# 串口参数选项（模块级常量，各对话框实例共用）
+_BAUDRATES = ("9600", "19200", "38400", "57600", "115200")
+_BYTESIZES = ("8", "7", "6", "5")
+_STOPBITS = ("1", "1.5", "2")
+PARITY_CODE_TO_LABEL = {'N': 'N (无校验)', 'E': 'E (偶校验)', 'O': 'O (奇校验)'}
+PARITY_LABEL_TO_CODE = {label: code for code, label in PARITY_CODE_TO_LABEL.items()}
+_PARITY_LABELS = tuple(PARITY_CODE_TO_LABEL.values())
+
+
 class AddSlaveDialog(QDialog):
     """添加 Slave 对话框"""
     
@@ -88,22 +97,22 @@ class AddSlaveDialog(QDialog):
         rtu_layout.addRow("串口端口*:", self.port_edit)
         
         self.baudrate_combo = QComboBox()
-        self.baudrate_combo.addItems(["9600", "19200", "38400", "57600", "115200"])
+        self.baudrate_combo.addItems(_BAUDRATES)
         self.baudrate_combo.setCurrentText("9600")
         rtu_layout.addRow("波特率:", self.baudrate_combo)
         
         self.bytesize_combo = QComboBox()
-        self.bytesize_combo.addItems(["8", "7", "6", "5"])
+        self.bytesize_combo.addItems(_BYTESIZES)
         self.bytesize_combo.setCurrentText("8")
         rtu_layout.addRow("数据位:", self.bytesize_combo)
         
         self.parity_combo = QComboBox()
-        self.parity_combo.addItems(["N (无校验)", "E (偶校验)", "O (奇校验)"])
-        self.parity_combo.setCurrentText("N (无校验)")
+        self.parity_combo.addItems(_PARITY_LABELS)
+        self.parity_combo.setCurrentText(PARITY_CODE_TO_LABEL['N'])
         rtu_layout.addRow("校验位:", self.parity_combo)
         
         self.stopbits_combo = QComboBox()
-        self.stopbits_combo.addItems(["1", "1.5", "2"])
+        self.stopbits_combo.addItems(_STOPBITS)
         self.stopbits_combo.setCurrentText("1")
         rtu_layout.addRow("停止位:", self.stopbits_combo)
         
@@ -375,8 +384,7 @@ class AddSlaveDialog(QDialog):
             config.baudrate = int(self.baudrate_combo.currentText())
             config.bytesize = int(self.bytesize_combo.currentText())
             
-            parity_text = self.parity_combo.currentText()
-            config.parity = parity_text[0]  # N, E, O
+            config.parity = PARITY_LABEL_TO_CODE.get(self.parity_combo.currentText(), 'N')
             
             stopbits_text = self.stopbits_combo.currentText()
             config.stopbits = int(float(stopbits_text))
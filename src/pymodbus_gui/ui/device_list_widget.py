@@ -2,15 +2,228 @@
 设备列表管理界面
 显示和管理所有设备
 """
+from typing import Dict, List, Optional, Tuple
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
-    QMenu
+    QTableView, QAbstractItemView, QHeaderView, QMessageBox,
+    QMenu, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush, QPalette
+
+from pymodbus_gui.core.device_manager import DeviceManager, ModbusDevice, ConnectionType
+
 
-from pymodbus_gui.core.device_manager import DeviceManager, ConnectionType
+# 自定义角色：一次返回单元格全部角色数据的字典
+MultipleRoles = Qt.ItemDataRole.UserRole + 1
+
+
+class DeviceTableModel(QAbstractTableModel):
+    """
+    设备列表数据模型
+    
+    直接持有设备对象列表，视图只对可见单元格调用 data()，
+    刷新时无需为每个单元格创建表格项。
+    """
+    
+    HEADERS = ("状态", "设备名称", "类型", "连接信息", "从站", "超时")
+    
+    # 共享的绘制常量，避免每个单元格重复创建
+    _BRUSH_CONNECTED = QBrush(QColor(13, 130, 93))  # 绿色
+    _BRUSH_DISCONNECTED = QBrush(QColor(213, 55, 52))  # 红色
+    _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._devices: List[ModbusDevice] = []
+        self._id_to_row: Dict[str, int] = {}
+        # 设备ID -> 第 1~5 列的显示文本（名称、类型、连接信息、从站、超时），配置变化时失效
+        self._display_cache: Dict[str, Tuple[str, str, str, str, str]] = {}
+    
+    def set_devices(self, devices: List[ModbusDevice]) -> None:
+        """
+        整体替换设备列表
+        
+        Args:
+            devices: 设备列表
+        """
+        self.beginResetModel()
+        self._devices = devices
+        self._id_to_row = {}
+        self._reindex()
+        self._invalidate_all()
+        self.endResetModel()
+    
+    def _reindex(self, start: int = 0) -> None:
+        """从指定行开始重建设备ID到行号的映射"""
+        for row in range(start, len(self._devices)):
+            self._id_to_row[self._devices[row].config.device_id] = row
+    
+    def row_of(self, device_id: str) -> int:
+        """获取设备所在行号，不存在时返回 -1"""
+        return self._id_to_row.get(device_id, -1)
+    
+    def update_device(self, device_id: str) -> None:
+        """
+        通知视图某个设备的状态或配置已变化，只重绘该行
+        
+        Args:
+            device_id: 设备ID
+        """
+        row = self.row_of(device_id)
+        if row >= 0:
+            self._invalidate(device_id)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def add_device(self, device: ModbusDevice) -> None:
+        """
+        在末尾追加一个设备
+        
+        Args:
+            device: 设备对象
+        """
+        row = len(self._devices)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._devices.append(device)
+        self._id_to_row[device.config.device_id] = row
+        self.endInsertRows()
+    
+    def remove_device(self, device_id: str) -> None:
+        """
+        移除一个设备
+        
+        Args:
+            device_id: 设备ID
+        """
+        row = self.row_of(device_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._devices[row]
+        del self._id_to_row[device_id]
+        self._invalidate(device_id)
+        self._reindex(row)
+        self.endRemoveRows()
+    
+    def device_at(self, row: int) -> Optional[ModbusDevice]:
+        """获取指定行的设备，行号无效时返回 None"""
+        if 0 <= row < len(self._devices):
+            return self._devices[row]
+        return None
+    
+    def _invalidate(self, device_id: str) -> None:
+        """清除单个设备的显示文本缓存"""
+        self._display_cache.pop(device_id, None)
+    
+    def _invalidate_all(self) -> None:
+        """清除全部显示文本缓存"""
+        self._display_cache.clear()
+    
+    def _display_texts(self, config) -> Tuple[str, str, str, str, str]:
+        """获取设备第 1~5 列的显示文本，未缓存时按当前配置生成"""
+        texts = self._display_cache.get(config.device_id)
+        if texts is None:
+            if config.connection_type == ConnectionType.RTU:
+                conn_info = f"{config.port}\n{config.baudrate}bps"
+            else:
+                conn_info = f"{config.host}\n:{config.tcp_port}"
+            texts = (
+                config.name,
+                config.connection_type.value,
+                conn_info,
+                str(config.slave_id),
+                f"{config.timeout}s",
+            )
+            self._display_cache[config.device_id] = texts
+        return texts
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._devices)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        roles = self._cell_roles(self._devices[index.row()], index.column())
+        if role == MultipleRoles:
+            return roles
+        return roles.get(role)
+    
+    def _cell_roles(self, device: ModbusDevice, col: int) -> dict:
+        """
+        一次性计算单元格的全部角色数据
+        
+        Args:
+            device: 设备对象
+            col: 列号
+            
+        Returns:
+            角色到数据的字典，未提供的角色不在其中
+        """
+        config = device.config
+        if col == 0:
+            if device.connected:
+                brush, tip = self._BRUSH_CONNECTED, "已连接"
+            else:
+                brush = self._BRUSH_DISCONNECTED
+                tip = "未连接" + (f"\n{device.error_message}" if device.error_message else "")
+            return {
+                Qt.ItemDataRole.DisplayRole: "●",
+                Qt.ItemDataRole.ForegroundRole: brush,
+                Qt.ItemDataRole.ToolTipRole: tip,
+                Qt.ItemDataRole.TextAlignmentRole: self._ALIGN_CENTER,
+            }
+        text = self._display_texts(config)[col - 1]
+        if col == 1:
+            return {
+                Qt.ItemDataRole.DisplayRole: text,
+                Qt.ItemDataRole.ToolTipRole: f"设备ID: {config.device_id}",
+            }
+        if col in (2, 3):
+            return {Qt.ItemDataRole.DisplayRole: text}
+        return {
+            Qt.ItemDataRole.DisplayRole: text,
+            Qt.ItemDataRole.TextAlignmentRole: self._ALIGN_CENTER,
+        }
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """
+    批量取数的绘制代理
+    
+    默认代理绘制每个单元格时要逐个角色调用模型的 data()，
+    这里通过 MultipleRoles 一次取回全部角色再填充样式选项。
+    """
+    
+    def initStyleOption(self, option, index):
+        roles = index.data(MultipleRoles)
+        if not isinstance(roles, dict):
+            super().initStyleOption(option, index)
+            return
+        
+        option.index = index
+        text = roles.get(Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = self.displayText(text, option.locale)
+        
+        alignment = roles.get(Qt.ItemDataRole.TextAlignmentRole)
+        if alignment is not None:
+            option.displayAlignment = alignment
+        
+        brush = roles.get(Qt.ItemDataRole.ForegroundRole)
+        if brush is not None:
+            palette = QPalette(option.palette)
+            palette.setBrush(QPalette.ColorRole.Text, brush)
+            option.palette = palette
 
 
 class DeviceListWidget(QWidget):
@@ -75,18 +288,16 @@ class DeviceListWidget(QWidget):
         toolbar_layout.addStretch()
         layout.addLayout(toolbar_layout)
         
-        # 设备列表表格
-        self.device_table = QTableWidget()
-        self.device_table.setColumnCount(6)  # 减少列数
-        self.device_table.setHorizontalHeaderLabels([
-            "状态", "设备名称", "类型", 
-            "连接信息", "从站", "超时"
-        ])
+        # 设备列表表格（模型/视图）
+        self.model = DeviceTableModel(self)
+        self.device_table = QTableView()
+        self.device_table.setModel(self.model)
+        self.device_table.setItemDelegate(SpeedUpDelegate(self.device_table))
         
         # 设置表格属性
-        self.device_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.device_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.device_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.device_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.device_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.device_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.device_table.setAlternatingRowColors(True)
         self.device_table.verticalHeader().setDefaultSectionSize(32)  # 设置行高
         
@@ -113,50 +324,7 @@ class DeviceListWidget(QWidget):
     
     def refresh_device_list(self):
         """刷新设备列表"""
-        self.device_table.setRowCount(0)
-        devices = self.device_manager.get_all_devices()
-        
-        for device in devices:
-            row = self.device_table.rowCount()
-            self.device_table.insertRow(row)
-            
-            # 状态
-            status_item = QTableWidgetItem("●")
-            if device.connected:
-                status_item.setForeground(QBrush(QColor(13, 130, 93)))  # 绿色
-                status_item.setToolTip("已连接")
-            else:
-                status_item.setForeground(QBrush(QColor(213, 55, 52)))  # 红色
-                status_item.setToolTip("未连接" + (f"\n{device.error_message}" if device.error_message else ""))
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.device_table.setItem(row, 0, status_item)
-            
-            # 设备名称
-            name_item = QTableWidgetItem(device.config.name)
-            name_item.setToolTip(f"设备ID: {device.config.device_id}")
-            self.device_table.setItem(row, 1, name_item)
-            
-            # 类型
-            type_item = QTableWidgetItem(device.config.connection_type.value)
-            self.device_table.setItem(row, 2, type_item)
-            
-            # 连接信息
-            if device.config.connection_type == ConnectionType.RTU:
-                conn_info = f"{device.config.port}\n{device.config.baudrate}bps"
-            else:
-                conn_info = f"{device.config.host}\n:{device.config.tcp_port}"
-            conn_item = QTableWidgetItem(conn_info)
-            self.device_table.setItem(row, 3, conn_item)
-            
-            # 从站地址
-            slave_item = QTableWidgetItem(str(device.config.slave_id))
-            slave_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.device_table.setItem(row, 4, slave_item)
-            
-            # 超时
-            timeout_item = QTableWidgetItem(f"{device.config.timeout}s")
-            timeout_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.device_table.setItem(row, 5, timeout_item)
+        self.model.set_devices(self.device_manager.get_all_devices())
     
     def get_selected_device_id(self) -> str:
         """
@@ -165,21 +333,17 @@ class DeviceListWidget(QWidget):
         Returns:
             设备ID，未选中返回空字符串
         """
-        current_row = self.device_table.currentRow()
-        if current_row >= 0:
-            # 从 tooltip 中获取设备ID
-            name_item = self.device_table.item(current_row, 1)
-            tooltip = name_item.toolTip()
-            if tooltip.startswith("设备ID: "):
-                return tooltip.replace("设备ID: ", "")
-        return ""
+        device = self.model.device_at(self.device_table.currentIndex().row())
+        return device.config.device_id if device else ""
     
     def add_device(self):
         """添加设备"""
         from pymodbus_gui.ui.add_device_dialog import AddDeviceDialog
         dialog = AddDeviceDialog(self.device_manager, self)
         if dialog.exec():
-            self.refresh_device_list()
+            device = self.device_manager.get_device(dialog.get_config().device_id)
+            if device:
+                self.model.add_device(device)
             if self.parent_window:
                 self.parent_window.show_status_message("设备添加成功")
     
@@ -196,9 +360,10 @@ class DeviceListWidget(QWidget):
             return
         
         result = self.device_manager.connect_device(device_id)
+        # 成功与失败都会改变状态列（失败时提示包含错误信息），只更新该行
+        self.model.update_device(device_id)
         
         if result.success:
-            self.refresh_device_list()
             QMessageBox.information(self, "成功", result.data)
             if self.parent_window:
                 self.parent_window.log_message(f"设备 {device_id} 连接成功", "SUCCESS")
@@ -206,8 +371,6 @@ class DeviceListWidget(QWidget):
             QMessageBox.critical(self, "连接失败", result.error)
             if self.parent_window:
                 self.parent_window.log_message(f"设备 {device_id} 连接失败: {result.error}", "ERROR")
-        
-        self.refresh_device_list()
     
     def disconnect_device(self):
         """断开设备"""
@@ -224,7 +387,7 @@ class DeviceListWidget(QWidget):
         result = self.device_manager.disconnect_device(device_id)
         
         if result.success:
-            self.refresh_device_list()
+            self.model.update_device(device_id)
             QMessageBox.information(self, "成功", result.data)
             if self.parent_window:
                 self.parent_window.log_message(f"设备 {device_id} 断开连接", "INFO")
@@ -248,7 +411,7 @@ class DeviceListWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             result = self.device_manager.remove_device(device_id)
             if result.success:
-                self.refresh_device_list()
+                self.model.remove_device(device_id)
                 if self.parent_window:
                     self.parent_window.show_status_message("设备删除成功")
                     self.parent_window.log_message(f"设备 {device_id} 已删除", "INFO")
@@ -269,13 +432,13 @@ class DeviceListWidget(QWidget):
         from pymodbus_gui.ui.add_device_dialog import AddDeviceDialog
         dialog = AddDeviceDialog(self.device_manager, self, edit_mode=True, device_config=device.config)
         if dialog.exec():
-            self.refresh_device_list()
+            self.model.update_device(device_id)
             if self.parent_window:
                 self.parent_window.show_status_message("设备配置已更新")
     
     def show_context_menu(self, position):
         """显示右键菜单"""
-        if self.device_table.currentRow() < 0:
+        if not self.device_table.currentIndex().isValid():
             return
         
         menu = QMenu()
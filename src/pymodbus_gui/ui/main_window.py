@@ -620,8 +620,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             # 断开所有 Poll 设备连接
             self.device_manager.disconnect_all()
-            # 停止所有 Slave 服务器
-            self.slave_manager.stop_all()
+            # 停止所有 Slave 服务器并关闭其事件循环
+            self.slave_manager.shutdown()
             event.accept()
         else:
             event.ignore()
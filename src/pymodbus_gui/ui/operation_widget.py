@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
-from pymodbus_gui.core.device_manager import DeviceManager
+from pymodbus_gui.core.device_manager import DeviceManager, ReadPayload
 
 
 class OperationWidget(QWidget):
@@ -272,31 +272,33 @@ class OperationWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "异常", f"执行异常: {str(e)}")
     
-    def display_result(self, data: dict, func_code: int):
+    def display_result(self, data, func_code: int):
         """显示操作结果"""
         self.result_table.setRowCount(0)
         
         # 读操作结果
-        if func_code in [1, 2, 3, 4] and 'values' in data:
-            values = data['values']
-            start_addr = data['address']
+        if func_code in [1, 2, 3, 4] and isinstance(data, ReadPayload):
+            values = data.values
+            start_addr = data.address
+            table = self.result_table
+            is_register = func_code in [3, 4]
             
-            for i, value in enumerate(values):
-                row = self.result_table.rowCount()
-                self.result_table.insertRow(row)
-                
-                # 地址
-                self.result_table.setItem(row, 0, QTableWidgetItem(str(start_addr + i)))
-                
-                # 值
-                self.result_table.setItem(row, 1, QTableWidgetItem(str(value)))
-                
-                # 十六进制（仅用于寄存器）
-                if func_code in [3, 4]:
-                    hex_val = f"0x{value:04X}"
-                    self.result_table.setItem(row, 2, QTableWidgetItem(hex_val))
-                else:
-                    self.result_table.setItem(row, 2, QTableWidgetItem("-"))
+            # 批量填充期间暂停重绘，行数一次设定，结束后统一刷新
+            table.setUpdatesEnabled(False)
+            try:
+                table.setRowCount(len(values))
+                for row, value in enumerate(values):
+                    # 地址
+                    table.setItem(row, 0, QTableWidgetItem(str(start_addr + row)))
+                    
+                    # 值
+                    table.setItem(row, 1, QTableWidgetItem(str(value)))
+                    
+                    # 十六进制（仅用于寄存器）
+                    hex_val = f"0x{value:04X}" if is_register else "-"
+                    table.setItem(row, 2, QTableWidgetItem(hex_val))
+            finally:
+                table.setUpdatesEnabled(True)
         
         # 写操作结果
         else:
@@ -197,16 +197,10 @@ class SlaveListWidget(QWidget):
             QMessageBox.information(self, "提示", "没有可启动的 Slave 服务器")
             return
         
-        success_count = 0
-        fail_count = 0
-        
-        for slave in slaves:
-            if not slave.running:
-                result = slave.start()
-                if result.success:
-                    success_count += 1
-                else:
-                    fail_count += 1
+        # 在 Slave 事件循环中并发启动
+        results = self.slave_manager.start_all()
+        success_count = sum(1 for result in results.values() if result.success)
+        fail_count = len(results) - success_count
         
         self.refresh_list()
         self.status_message.emit(f"启动完成: 成功 {success_count} 个，失败 {fail_count} 个")
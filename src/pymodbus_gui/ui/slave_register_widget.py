@@ -272,8 +272,7 @@ class SlaveRegisterWidget(QWidget):
         if result.success:
             data = result.data
             # 显示文件内容（前256字节）
-            preview = data[:256]
-            hex_str = ' '.join([f'{b:02X}' for b in preview])
+            hex_str = memoryview(data)[:256].hex(' ').upper()
             
             msg = f"文件 {file_number} 读取成功\n"
             msg += f"大小: {len(data)} 字节\n\n"
@@ -0,0 +1,130 @@
+"""
+设备管理器测试
+"""
+import unittest
+from unittest import mock
+
+try:
+    from pymodbus_gui.core import device_manager
+    from pymodbus_gui.core.device_manager import DeviceManager, DeviceConfig, ConnectionType
+except ImportError:  # 未安装 pymodbus 时跳过
+    device_manager = None
+
+
+@unittest.skipIf(device_manager is None, "需要 pymodbus")
+class UpdateDeviceTransportTest(unittest.TestCase):
+    """编辑设备连接类型后的收发行为"""
+
+    def test_edit_rtu_to_tcp_then_read(self):
+        manager = DeviceManager()
+        manager.add_device(DeviceConfig(
+            device_id="DEV_001",
+            name="测试设备",
+            connection_type=ConnectionType.RTU,
+            port="/dev/does-not-exist",
+            timeout=0.1
+        ))
+        # RTU 连接失败，但已计算帧间静默间隔
+        self.assertFalse(manager.connect_device("DEV_001").success)
+
+        result = manager.update_device(DeviceConfig(
+            device_id="DEV_001",
+            name="测试设备",
+            connection_type=ConnectionType.TCP,
+            host="127.0.0.1",
+            tcp_port=5020,
+            timeout=0.1
+        ))
+        self.assertTrue(result.success)
+
+        # TCP 客户端的 socket 没有串口专用的 reset_input_buffer
+        response = mock.Mock(registers=[1, 2])
+        response.isError.return_value = False
+        client = mock.Mock(socket=object())
+        client.connect.return_value = True
+        client.read_holding_registers.return_value = response
+
+        with mock.patch.object(device_manager, "ModbusTcpClient", return_value=client):
+            self.assertTrue(manager.connect_device("DEV_001").success)
+            device = manager.get_device("DEV_001")
+            self.assertEqual(device.silent_interval, 0.0)
+
+            result = device.read_holding_registers(0, 2)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.data.values, [1, 2])
+        client.read_holding_registers.assert_called_once_with(address=0, count=2, slave=1)
+
+
+@unittest.skipIf(device_manager is None, "需要 pymodbus")
+class TcpClientPoolTest(unittest.TestCase):
+    """同一 host:port 的设备共享 TCP 连接"""
+
+    def setUp(self):
+        self.manager = DeviceManager()
+        for slave_id in (1, 2):
+            self.manager.add_device(DeviceConfig(
+                device_id=f"DEV_{slave_id}",
+                name=f"网关从站{slave_id}",
+                connection_type=ConnectionType.TCP,
+                slave_id=slave_id,
+                host="127.0.0.1",
+                tcp_port=5020,
+                timeout=0.1
+            ))
+        self.client = mock.Mock(socket=None)
+        self.client.connect.return_value = True
+        patcher = mock.patch.object(device_manager, "ModbusTcpClient", return_value=self.client)
+        self.client_factory = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refcount_and_release(self):
+        self.assertTrue(self.manager.connect_device("DEV_1").success)
+        self.assertTrue(self.manager.connect_device("DEV_2").success)
+
+        # 两个设备共用一个客户端和一把请求锁
+        self.client_factory.assert_called_once()
+        self.assertEqual(len(self.manager._tcp_pool), 1)
+        entry = next(iter(self.manager._tcp_pool.values()))
+        self.assertEqual(entry.refcount, 2)
+        dev1, dev2 = self.manager.get_device("DEV_1"), self.manager.get_device("DEV_2")
+        self.assertIs(dev1.client, dev2.client)
+        self.assertIs(dev1.client_lock, dev2.client_lock)
+
+        # 断开一个设备不影响另一个
+        self.assertTrue(self.manager.disconnect_device("DEV_1").success)
+        self.assertEqual(entry.refcount, 1)
+        self.client.close.assert_not_called()
+        self.assertIsNone(dev1.client)
+
+        # 最后一个设备断开时关闭连接并移出连接池
+        self.assertTrue(self.manager.disconnect_device("DEV_2").success)
+        self.client.close.assert_called_once()
+        self.assertEqual(self.manager._tcp_pool, {})
+
+    def test_disconnect_while_waiting_for_request_lock(self):
+        self.assertTrue(self.manager.connect_device("DEV_1").success)
+        device = self.manager.get_device("DEV_1")
+        lock = device.client_lock
+
+        class DisconnectWhileWaiting:
+            """模拟请求通过快速检查后、拿到请求锁前设备被断开"""
+            def __enter__(self):
+                lock.acquire()
+                device.connected = False
+                device.client = None
+                return self
+
+            def __exit__(self, *exc):
+                lock.release()
+                return False
+
+        device.client_lock = DisconnectWhileWaiting()
+        result = device.read_holding_registers(0, 1)
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "设备未连接")
+        self.client.read_holding_registers.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+寄存器点表管理器测试
+"""
+import os
+import tempfile
+import unittest
+
+try:
+    from openpyxl import Workbook
+    from pymodbus_gui.core.register_manager import RegisterManager
+except ImportError:  # 未安装 openpyxl / pymodbus / numpy 时跳过
+    RegisterManager = None
+
+
+@unittest.skipIf(RegisterManager is None, "需要 openpyxl、pymodbus 和 numpy")
+class ImportRangeTest(unittest.TestCase):
+    """点表导入时的地址和初始值范围检查"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.manager = RegisterManager()
+
+    def _write_sheet(self, rows):
+        file_path = os.path.join(self.tmp_dir.name, "points.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "寄存器点表"
+        ws.append(RegisterManager.COLUMNS)
+        for row in rows:
+            ws.append(row)
+        wb.save(file_path)
+        return file_path
+
+    def test_out_of_range_rows_are_reported(self):
+        file_path = self._write_sheet([
+            (0, '温度', '保持寄存器', 25, '', '', '', '', '否'),
+            (70000, '越界地址', '保持寄存器', 0, '', '', '', '', '否'),
+            (1, '越界值', '保持寄存器', 70000, '', '', '', '', '否'),
+        ])
+
+        result = self.manager.import_register_points(file_path)
+        self.assertTrue(result.success)
+        self.assertEqual([p.name for p in result.data], ['温度'])
+        self.assertIn("第 3 行", result.error)
+        self.assertIn("第 4 行", result.error)
+
+    def test_import_as_columns_does_not_raise(self):
+        file_path = self._write_sheet([
+            (70000, '越界地址', '保持寄存器', 0, '', '', '', '', '否'),
+            (1, '越界值', '保持寄存器', 70000, '', '', '', '', '否'),
+        ])
+
+        result = self.manager.import_as_columns(file_path)
+        self.assertFalse(result.success)
+        self.assertIn("超出范围", result.error)
+
+
+if __name__ == '__main__':
+    unittest.main()
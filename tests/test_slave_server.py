@@ -0,0 +1,105 @@
+"""
+Slave 服务器测试
+"""
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+try:
+    from pymodbus_gui.core import slave_server
+    from pymodbus_gui.core.slave_server import (
+        ModbusSlave, SlaveManager, SlaveConfig, SlaveConnectionType, FileRecordConfig
+    )
+except ImportError:  # 未安装 pymodbus / numpy 时跳过
+    slave_server = None
+
+
+def _free_port():
+    """获取一个当前空闲的本地 TCP 端口"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _run_concurrently(target, count):
+    """在多个线程中同时执行 target，返回各线程抛出的异常"""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+@unittest.skipIf(slave_server is None, "需要 pymodbus 和 numpy")
+class FileFlushTest(unittest.TestCase):
+    """文件记录落盘"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "record.bin")
+        self.config = SlaveConfig(
+            slave_id="S1",
+            name="测试从站",
+            connection_type=SlaveConnectionType.TCP,
+            host="127.0.0.1",
+            tcp_port=_free_port(),
+            file_records=[FileRecordConfig(file_number=1, file_path=self.file_path)],
+            enable_file_operations=True
+        )
+        self.slave = ModbusSlave(self.config)
+
+    def tearDown(self):
+        slave_server._shared_loop.close()
+        self.tmp_dir.cleanup()
+
+    def _read_file(self):
+        with open(self.file_path, 'rb') as f:
+            return f.read()
+
+    def test_write_file_atomic_concurrent(self):
+        errors = _run_concurrently(
+            lambda: slave_server._write_file_atomic(self.file_path, b"\x01" * 64), 8
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual(self._read_file(), b"\x01" * 64)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["record.bin"])
+
+    def test_concurrent_flushes_keep_latest_data(self):
+        for i in range(20):
+            data = bytes([i]) * 4
+            self.assertTrue(self.slave.write_file_record(1, 0, data).success)
+            errors = _run_concurrently(self.slave.flush_files, 2)
+            self.assertEqual(errors, [])
+            self.assertEqual(self._read_file(), data)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["record.bin"])
+
+    def test_stop_all_persists_pending_writes(self):
+        manager = SlaveManager()
+        self.assertTrue(manager.add_slave(self.config).success)
+        self.assertTrue(manager.start_slave("S1").success)
+        slave = manager.get_slave("S1")
+        self.assertTrue(slave.running)
+
+        # 在延迟落盘触发之前停止，数据仍应写入磁盘
+        self.assertTrue(slave.write_file_record(1, 0, b"\x12\x34").success)
+        manager.stop_all()
+
+        self.assertFalse(slave.running)
+        self.assertEqual(self._read_file(), b"\x12\x34")
+
+
+if __name__ == '__main__':
+    unittest.main()